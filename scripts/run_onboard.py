@@ -5,6 +5,7 @@ Usage:
   python scripts/run_onboard.py TASK-001 [codebase_path]
   python scripts/run_onboard.py TASK-001                    # use current dir as codebase
   python scripts/run_onboard.py TASK-001 /path/to/project    # index that project
+  python scripts/run_onboard.py TASK-001 --no-cache          # force a fresh LLM call
 Requires: credentials.json, sheet shared with service account, Ollama running (llama3).
 """
 
@@ -18,13 +19,15 @@ DEFAULT_SHEET = "https://docs.google.com/spreadsheets/d/1W0yefAMKumwLq4VbsOHUHnp
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/run_onboard.py TASK-001 [codebase_path]")
+    use_cache = "--no-cache" not in sys.argv
+    args = [a for a in sys.argv[1:] if a != "--no-cache"]
+    if not args:
+        print("Usage: python scripts/run_onboard.py TASK-001 [codebase_path] [--no-cache]")
         print("  TASK-001 = task ID in your Google Sheet")
         print("  codebase_path = path to project to index (default: current directory)")
         return 1
-    task_id = sys.argv[1].strip()
-    codebase_root = Path(sys.argv[2]).resolve() if len(sys.argv) > 2 else ROOT
+    task_id = args[0].strip()
+    codebase_root = Path(args[1]).resolve() if len(args) > 1 else ROOT
 
     from src.orchestration import run_pipeline
     from src.sheet_reader.config import get_credentials_path
@@ -35,24 +38,28 @@ def main():
         return 1
 
     print(f"Running pipeline: task_id={task_id}, codebase={codebase_root}")
-    print("Fetching task from sheet → indexing codebase → calling Ollama...\n")
+    print("Fetching task from sheet → indexing codebase → calling Ollama (streaming)...\n")
     result = run_pipeline(
         task_id=task_id,
         sheet_url=DEFAULT_SHEET,
         codebase_root=codebase_root,
         credentials_path=creds,
+        stream=True,
+        guide_cache_dir=(ROOT / ".onboard-cache") if use_cache else None,
     )
 
     if result.error:
         print(f"Error: {result.error}")
         return 1
 
-    print(f"Task: [{result.task_id}] {result.task_title}\n")
-    print("=== FILES TO TOUCH (in order) ===")
-    for i, path in enumerate(result.files_ordered, 1):
-        print(f"  {i}. {path}")
-    print("\n=== STEP-BY-STEP GUIDE ===")
-    print(result.steps_text or result.raw_guide_response[:2000])
+    # The guide was already printed token-by-token; recap task and file list.
+    # Buffered into one write so slow terminals/pipes see a single syscall.
+    out = [
+        f"\nTask: [{result.task_id}] {result.task_title}\n",
+        "=== FILES TO TOUCH (in order) ===",
+    ]
+    out.extend(f"  {i}. {path}" for i, path in enumerate(result.files_ordered, 1))
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Run the onboarding flow for several task IDs against one codebase.
+The codebase is scanned once and the system prompt + index stay
+byte-identical across tasks, so Ollama serves tasks 2..N from its
+prefill KV cache instead of re-processing the shared prefix.
+Usage:
+  python scripts/run_onboard_batch.py TASK-001 TASK-002 [...] [--codebase PATH] [--no-cache]
+Requires: credentials.json, sheet shared with service account, Ollama running (llama3).
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_SHEET = "https://docs.google.com/spreadsheets/d/1W0yefAMKumwLq4VbsOHUHnpS4ksDRsVFrdgSP1ox_6s/edit#gid=0"
+
+
+def main():
+    use_cache = "--no-cache" not in sys.argv
+    args = [a for a in sys.argv[1:] if a != "--no-cache"]
+    codebase_root = ROOT
+    if "--codebase" in args:
+        idx = args.index("--codebase")
+        codebase_root = Path(args[idx + 1]).resolve()
+        del args[idx:idx + 2]
+    task_ids = [a.strip() for a in args if a.strip()]
+    if not task_ids:
+        print("Usage: python scripts/run_onboard_batch.py TASK-001 [TASK-002 ...] [--codebase PATH] [--no-cache]")
+        return 1
+
+    from src.parser import scan_project, build_index, format_index_for_llm
+    from src.reasoning import generate_task_guide
+    from src.sheet_reader import SheetTaskReader
+    from src.sheet_reader.config import get_credentials_path
+
+    creds = get_credentials_path(ROOT)
+    if not creds.is_file():
+        print("credentials.json not found. Place it in project root.")
+        return 1
+
+    print(f"Indexing codebase: {codebase_root}")
+    files = scan_project(codebase_root, cache_dir=codebase_root / ".onboard-cache")
+    codebase_text = format_index_for_llm(build_index(files), max_files=300)
+    print(f"Index: {len(files)} files\n")
+
+    reader = SheetTaskReader(credentials_path=creds)
+    failures = 0
+    for task_id in task_ids:
+        task = reader.get_task_by_id(DEFAULT_SHEET, task_id)
+        if not task:
+            print(f"--- [{task_id}] not found in sheet, skipping\n")
+            failures += 1
+            continue
+        print(f"--- [{task.task_id}] {task.title}\n")
+        try:
+            generate_task_guide(
+                task_title=task.title,
+                task_description=task.description,
+                codebase_index_text=codebase_text,
+                stream=True,
+                cache_dir=(ROOT / ".onboard-cache") if use_cache else None,
+            )
+        except Exception as e:
+            print(f"Error generating guide for {task_id}: {e}")
+            failures += 1
+        print()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,7 @@ from src.parser import scan_project, build_index, format_index_for_llm
 def main():
     root = ROOT
     print(f"Scanning: {root}\n")
-    files = scan_project(root)
+    files = scan_project(root, cache_dir=root / ".onboard-cache")
     print(f"Found {len(files)} files\n")
     index = build_index(files)
     print("=== File tree ===")
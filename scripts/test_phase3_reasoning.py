@@ -6,6 +6,7 @@ Usage:
     -> uses a built-in sample task and this repo as codebase
   python scripts/test_phase3_reasoning.py --task-id TASK-001 --sheet URL
     -> fetches task from sheet, uses this repo as codebase
+  Pass --no-cache to skip the on-disk LLM response cache.
 Requires: Ollama running (ollama serve) and a model (e.g. ollama pull llama3)
 """
 
@@ -46,18 +47,20 @@ def main():
     from src.reasoning import generate_task_guide
 
     print("Building codebase index from this repo...")
-    files = scan_project(ROOT)
+    files = scan_project(ROOT, cache_dir=ROOT / ".onboard-cache")
     index = build_index(files)
     codebase_text = format_index_for_llm(index, max_files=200)
     print(f"Index: {len(files)} files\n")
 
-    print("Calling Ollama...")
+    print("Calling Ollama (streaming)...\n")
     try:
         result = generate_task_guide(
             task_title=task_title,
             task_description=task_description,
             codebase_index_text=codebase_text,
             model="llama3",
+            stream=True,
+            cache_dir=None if "--no-cache" in sys.argv else ROOT / ".onboard-cache",
         )
     except ConnectionError as e:
         print(f"Ollama connection error: {e}")
@@ -67,11 +70,11 @@ def main():
         print(f"Error: {e}")
         return 1
 
-    print("\n=== FILES TO TOUCH (in order) ===")
-    for i, path in enumerate(result.files_ordered, 1):
-        print(f"  {i}. {path}")
-    print("\n=== STEP-BY-STEP GUIDE ===")
-    print(result.steps_text or result.raw_response[:1500])
+    # The guide was already printed token-by-token; recap the parsed file list
+    # (buffered into one write so it lands as a single syscall).
+    out = ["\n=== FILES TO TOUCH (in order) ==="]
+    out.extend(f"  {i}. {path}" for i, path in enumerate(result.files_ordered, 1))
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
@@ -14,69 +14,221 @@ Key Agentic Features:
 - Configurable verbosity
 """
 
+import fnmatch
+import functools
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-import hashlib
 import json
 
-from crewai import Agent, Crew, Task
-from crewai.tools import tool
-from crewai import LLM
+try:
+    # orjson serializes/parses several times faster than stdlib json.
+    import orjson
 
-from src.sheet_reader import SheetTaskReader
-from src.sheet_reader.config import get_credentials_path
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+# CrewAI (and through the sheet reader, gspread/google-auth) are heavy
+# imports; they are pulled in lazily inside build_crew and the sheet tools
+# so module import — and tools like search_codebase — stay fast.
 from src.parser import scan_project, build_index, format_index_for_llm
+from src.parser.cache import hash_bytes
 
 
 # === Configuration ===
 # #/Users/gc/Desktop/Onboard_AI/src/index_cache/.onboard_cache
-INDEX_CACHE_DIR = Path(__file__).parent.parent.parent / "src/index_cache/.onboard_cache"      
+INDEX_CACHE_DIR = Path(__file__).parent.parent.parent / "src/index_cache/.onboard_cache"
 # INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Directories to always exclude from search (vendored, caches, VCS internals).
+EXCLUDED_DIRS = {
+    ".venv", "venv", "env", ".env",
+    "node_modules", "__pycache__", ".git",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    "dist", "build", ".eggs", ".onboard-cache",
+}
+
+# search_codebase returns at most this many matches, so stop scanning as
+# soon as the cap is exceeded instead of reading the rest of the tree.
+SEARCH_MATCH_CAP = 50
+
+# Bound worst-case search work: skip single files larger than this (likely
+# generated/minified) and stop opening new files past the aggregate budget.
+SEARCH_MAX_FILE_BYTES = 2 * 1024 * 1024
+SEARCH_BYTE_BUDGET = 64 * 1024 * 1024
+
+# Cap cached file entries so the cache file stays fast to read no matter
+# how large the indexed repo is.
+CACHE_MAX_FILES = 10_000
+
 
 # === Caching Utilities ===
 
-def _get_cache_path(root: Path) -> Path:
-    """Get cache file path for a codebase root."""
-    root_hash = hashlib.md5(str(root.resolve()).encode()).hexdigest()
+@functools.lru_cache(maxsize=256)
+def _resolved_abs(path_str: str) -> Path:
+    return Path(path_str).resolve()
+
+
+def _resolved(path_str: str) -> Path:
+    """
+    Resolve a path, memoized per process; resolve() hits the kernel each
+    call. Relative paths depend on the cwd, so only absolute paths are
+    cached.
+    """
+    if not os.path.isabs(path_str):
+        return Path(path_str).resolve()
+    return _resolved_abs(path_str)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_cache_path(root: str) -> Path:
+    """Get cache file path for a (resolved) codebase root string."""
+    root_hash = f"{hash_bytes(root.encode()):016x}"
     return INDEX_CACHE_DIR / f"index_{root_hash}.json"
 
 
-def _get_cached_index(root: Path, max_files: int = 300) -> Optional[str]:
-    """Try to load cached index. Returns None if cache is stale or missing."""
-    cache_path = _get_cache_path(root)
+def _tree_fingerprint(root: Path) -> dict:
+    """
+    Cheap whole-tree fingerprint: file count, newest mtime, total size.
+    One scandir walk with no file reads — unlike the root directory's own
+    mtime, this catches edits inside nested directories, and the size term
+    catches same-mtime edits.
+    """
+    n = 0
+    mtime_max = 0
+    size_sum = 0
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if name not in EXCLUDED_DIRS and not name.endswith(".egg-info"):
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        n += 1
+                        size_sum += st.st_size
+                        if st.st_mtime_ns > mtime_max:
+                            mtime_max = st.st_mtime_ns
+        except OSError:
+            continue
+    return {"n": n, "mtime_max": mtime_max, "size_sum": size_sum}
+
+
+# In-process memo of rendered cache hits keyed by (root, cache file mtime,
+# max_files): agents often call index_codebase repeatedly within one run,
+# and a memo hit skips even reading/parsing the cache JSON.
+_RENDERED_MEMO: dict[tuple[str, int, int], tuple[dict, str]] = {}
+_RENDERED_MEMO_MAX = 32
+
+
+def _get_cached_index(root: Path, max_files: int = 300) -> tuple[Optional[str], Optional[dict]]:
+    """
+    Try to load the cached index. Returns (rendered, fingerprint); rendered
+    is None if the cache is stale or missing, and the fingerprint (when the
+    validity walk ran) can be reused by the caller when re-saving, so a
+    cache miss doesn't pay for a second tree walk.
+    """
+    cache_path = _get_cache_path(str(root))
     if not cache_path.exists():
-        return None
-    
-    # Check if cache is older than root directory
+        return None, None
+
+    fingerprint = None
     try:
-        root_mtime = root.stat().st_mtime
-        cache_mtime = cache_path.stat().st_mtime
-        
-        if cache_mtime < root_mtime:
-            # Root was modified after cache - invalidate
-            return None
-        
-        with open(cache_path) as f:
-            data = json.load(f)
-        return format_index_for_llm(data, max_files=max_files)
+        memo_key = (str(root), cache_path.stat().st_mtime_ns, max_files)
+        fingerprint = _tree_fingerprint(root)
+        memo = _RENDERED_MEMO.get(memo_key)
+        if memo is not None and memo[0] == fingerprint:
+            return memo[1], fingerprint
+        data = _loads(cache_path.read_bytes())
+        if data.get("fingerprint") != fingerprint:
+            return None, fingerprint  # Something under root changed - invalidate
+        # Prefer the pre-rendered string saved with the cache; re-render
+        # only when asked for a max_files the cache doesn't carry.
+        rendered = data.get("rendered", {}).get(str(max_files))
+        if rendered is None:
+            rendered = format_index_for_llm(data["index"], max_files=max_files)
+        while len(_RENDERED_MEMO) >= _RENDERED_MEMO_MAX:
+            _RENDERED_MEMO.pop(next(iter(_RENDERED_MEMO)))
+        _RENDERED_MEMO[memo_key] = (fingerprint, rendered)
+        return rendered, fingerprint
     except Exception:
-        return None
+        return None, fingerprint
 
 
-def _save_cache(root: Path, index_data: dict) -> None:
-    """Save index to cache."""
-    cache_path = _get_cache_path(root)
+def _save_cache(
+    root: Path,
+    index_data: dict,
+    rendered: dict[str, str] | None = None,
+    fingerprint: dict | None = None,
+) -> None:
+    """
+    Save index to cache alongside the tree fingerprint used for validity
+    and any already-rendered LLM strings keyed by max_files.
+    """
+    cache_path = _get_cache_path(str(root))
     try:
-        with open(cache_path, "w") as f:
-            json.dump(index_data, f)
+        INDEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        files = index_data.get("files")
+        if files is not None and len(files) > CACHE_MAX_FILES:
+            index_data = dict(index_data, files=files[:CACHE_MAX_FILES])
+        payload = {
+            "fingerprint": fingerprint if fingerprint is not None else _tree_fingerprint(root),
+            "index": index_data,
+            "rendered": rendered or {},
+        }
+        # Write-then-rename: a Ctrl-C mid-write can't leave a corrupt cache
+        # that silently forces a full re-index on every later run.
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        tmp_path.write_bytes(_dumps(payload))
+        os.replace(tmp_path, cache_path)
     except Exception:
         pass  # Non-critical if caching fails
 
 
+# CrewAI may invoke the sheet tools several times per run; cache the full
+# task list briefly so they share one authenticated fetch.
+_TASKS_CACHE_TTL = 300.0  # seconds
+_tasks_cache: dict[tuple[str, str], tuple[float, tuple]] = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_reader(credentials_path: str):
+    from src.sheet_reader import SheetTaskReader
+
+    return SheetTaskReader(credentials_path=credentials_path)
+
+
+def _all_sheet_tasks(sheet_url: str) -> tuple:
+    """All tasks in the sheet, cached for _TASKS_CACHE_TTL seconds."""
+    from src.sheet_reader.config import get_credentials_path
+
+    creds = str(get_credentials_path())
+    key = (sheet_url, creds)
+    now = time.monotonic()
+    hit = _tasks_cache.get(key)
+    if hit is not None and now - hit[0] < _TASKS_CACHE_TTL:
+        return hit[1]
+    tasks = tuple(_get_reader(creds).get_all_tasks(sheet_url))
+    _tasks_cache[key] = (now, tasks)
+    return tasks
+
+
 # === Tools wrapping existing functionality ===
 
-@tool("get_task_from_sheet")
 def get_task_from_sheet(task_id: str, sheet_url: str) -> str:
     """
     Fetch a task from the Google Sheet.
@@ -89,47 +241,53 @@ def get_task_from_sheet(task_id: str, sheet_url: str) -> str:
 
     Do NOT wrap inputs inside 'properties'.
     """
-    reader = SheetTaskReader(credentials_path=get_credentials_path())
-    task = reader.get_task_by_id(sheet_url, task_id)
+    task_id_clean = str(task_id).strip().lower()
+    task = next(
+        (t for t in _all_sheet_tasks(sheet_url) if t.task_id.lower() == task_id_clean),
+        None,
+    )
     if not task:
         return f'{{"error": "TASK_{task_id}_NOT_FOUND in sheet {sheet_url}"}}'
-    # Simple JSON-ish string (model can parse it)
-    return (
-        "{"
-        f"\"task_id\": \"{task.task_id}\", "
-        f"\"assignee\": \"{task.assignee}\", "
-        f"\"title\": \"{task.title}\", "
-        f"\"description\": \"{task.description}\", "
-        f"\"status\": \"{task.status}\""
-        "}"
+    # Real JSON: quotes/newlines in sheet cells stay parseable, so the
+    # model doesn't burn a retry round-trip on a malformed payload.
+    return json.dumps(
+        {
+            "task_id": task.task_id,
+            "assignee": task.assignee,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+        },
+        ensure_ascii=False,
     )
 
 
-@tool("index_codebase")
 def index_codebase(root: str, use_cache: bool = True) -> str:
     """
     Scan a codebase root and return a human-readable summary (file tree, file list).
     
     Uses caching to avoid repeated scans. Set use_cache=False to force re-index.
     """
-    root_path = Path(root).resolve()
-    
+    root_path = _resolved(root)
+
     # Try cache first (unless disabled)
+    fingerprint = None
     if use_cache:
-        cached = _get_cached_index(root_path)
+        cached, fingerprint = _get_cached_index(root_path)
         if cached:
             return "[CACHED] " + cached
-    
-    files = scan_project(root_path)
+
+    files = scan_project(root_path, cache_dir=root_path / ".onboard-cache", max_detailed=300)
     index = build_index(files)
-    
-    # Save to cache
-    _save_cache(root_path, index)
-    
-    return format_index_for_llm(index, max_files=300)
+
+    # Save to cache, including the rendered string so hits skip re-rendering
+    # (the fingerprint from the validity walk is reused when available).
+    text = format_index_for_llm(index, max_files=300)
+    _save_cache(root_path, index, rendered={"300": text}, fingerprint=fingerprint)
+
+    return text
 
 
-@tool("read_file")
 def read_file(file_path: str) -> str:
     """
     Read the contents of a specific file from the codebase.
@@ -144,26 +302,27 @@ def read_file(file_path: str) -> str:
     IMPORTANT: Only use paths that were listed in a previous task output. Try each file only ONCE.
     If not found, accept it and move on immediately. Do not retry.
     """
-    path = Path(file_path)
-    
-    # Try relative to current directory, or absolute
-    if not path.is_file():
-        path = Path.cwd() / file_path
-    
-    if not path.is_file():
-        return f'{{"error": "FILE_NOT_FOUND: {file_path}"}}'
-    
-    try:
-        # Limit file size to avoid huge outputs
-        content = path.read_text()
+    # Try the open directly (as given, then relative to cwd) instead of
+    # stat-ing up to three times before one read; the open's own fd stat
+    # supplies the size for the cap check.
+    for candidate in (Path(file_path), Path.cwd() / file_path):
+        try:
+            with candidate.open("r", encoding="utf-8", errors="replace") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > 50_000_000:
+                    return f'{{"error": "FILE_TOO_LARGE: {file_path} ({size} bytes)"}}'
+                # Only read up to the display cap instead of the whole file.
+                content = f.read(10001)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            continue
+        except Exception as e:
+            return f'{{"error": "Failed to read file: {str(e)}"}}'
         if len(content) > 10000:
-            content = content[:10000] + f"\n\n... (truncated, total {len(content)} chars)"
-        return f"=== FILE: {path.name} ===\n{content}"
-    except Exception as e:
-        return f'{{"error": "Failed to read file: {str(e)}"}}'
+            content = content[:10000] + f"\n\n... (truncated, total {size} bytes)"
+        return f"=== FILE: {candidate.name} ===\n{content}"
+    return f'{{"error": "FILE_NOT_FOUND: {file_path}"}}'
 
 
-@tool("search_codebase")
 def search_codebase(root: str, pattern: str, file_pattern: str = "*.py") -> str:
     """
     Search for a pattern in code files within the codebase.
@@ -183,46 +342,115 @@ def search_codebase(root: str, pattern: str, file_pattern: str = "*.py") -> str:
     IMPORTANT: root must be the exact absolute path you were given. Do not guess or invent it.
     pattern must be a non-empty search string. Do not pass an empty string for pattern.
     """
-    # Directories to always exclude from search
-    EXCLUDED_DIRS = {
-        ".venv", "venv", "env", ".env",
-        "node_modules", "__pycache__", ".git",
-        ".mypy_cache", ".pytest_cache", ".ruff_cache",
-        "dist", "build", ".eggs", "*.egg-info",
-    }
-
-    root_path = Path(root).resolve()
+    root_path = _resolved(root)
+    # One compiled case-insensitive literal; finditer scans each buffer in
+    # the C regex engine instead of a Python loop over lines.
+    pattern_re = re.compile(re.escape(pattern), re.IGNORECASE)
     matches = []
 
+    # Compile the filename filter once instead of fnmatch-ing every file;
+    # the common '*.ext' case becomes a C-level suffix check.
+    if file_pattern == "*":
+        name_matches = None  # everything matches
+    elif file_pattern.startswith("*.") and not any(c in file_pattern[2:] for c in "*?["):
+        suffix = file_pattern[1:]
+        name_matches = lambda fn: fn.endswith(suffix)
+    else:
+        file_pattern_re = re.compile(fnmatch.translate(file_pattern))
+        name_matches = lambda fn: file_pattern_re.match(fn) is not None
+
+    def scan_one(path: Path) -> list[str]:
+        found: list[str] = []
+        try:
+            with open(path, "rb", buffering=0) as f:
+                content = f.read().decode("utf-8")  # strict: skips binary files
+        except Exception:
+            return found
+        rel_path = None
+        lineno = 1
+        pos = 0
+        last_line_start = -1
+        for m in pattern_re.finditer(content):
+            # Incremental newline count keeps line numbering O(filesize)
+            # in total, no matter how many matches there are.
+            lineno += content.count("\n", pos, m.start())
+            pos = m.start()
+            line_start = content.rfind("\n", 0, m.start()) + 1
+            if line_start == last_line_start:
+                continue  # one result per line, like the old per-line scan
+            last_line_start = line_start
+            line_end = content.find("\n", m.end())
+            if line_end == -1:
+                line_end = len(content)
+            if rel_path is None:
+                rel_path = path.relative_to(root_path)
+            found.append(f"{rel_path}:{lineno}: {content[line_start:line_end].strip()}")
+            if len(found) > SEARCH_MATCH_CAP:
+                break
+        return found
+
     try:
-        for path in root_path.rglob(file_pattern):
-            # Skip any file whose path contains an excluded directory
-            if any(part in EXCLUDED_DIRS for part in path.parts):
+        candidates: list[Path] = []
+        bytes_budgeted = 0
+        truncated = False
+        # Manual scandir walk: skips excluded directories before descending
+        # and reuses the directory entries' cached stat for the size checks.
+        stack = [str(root_path)]
+        while stack and not truncated:
+            d = stack.pop()
+            try:
+                entries = os.scandir(d)
+            except OSError:
                 continue
-            if path.is_file():
-                try:
-                    content = path.read_text()
-                    for i, line in enumerate(content.splitlines(), 1):
-                        # Simple substring match
-                        if pattern.lower() in line.lower():
-                            rel_path = path.relative_to(root_path)
-                            matches.append(f"{rel_path}:{i}: {line.strip()}")
-                except Exception:
-                    pass
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if name not in EXCLUDED_DIRS and not name.endswith(".egg-info"):
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and (
+                        name_matches is None or name_matches(entry.name)
+                    ):
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+                        if size > SEARCH_MAX_FILE_BYTES:
+                            continue
+                        if bytes_budgeted + size > SEARCH_BYTE_BUDGET:
+                            truncated = True
+                            break
+                        bytes_budgeted += size
+                        candidates.append(Path(entry.path))
+        # Reads release the GIL, so a thread pool overlaps disk latency
+        # across files; results keep walk order.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+            futures = [ex.submit(scan_one, p) for p in candidates]
+            for fut in futures:
+                matches.extend(fut.result())
+                if len(matches) > SEARCH_MATCH_CAP:
+                    ex.shutdown(cancel_futures=True)
+                    break
     except Exception as e:
         return f'{{"error": "Search failed: {str(e)}"}}'
 
+    if truncated and len(matches) <= SEARCH_MATCH_CAP:
+        matches.append(
+            f"... (search stopped after scanning {SEARCH_BYTE_BUDGET // (1024 * 1024)} MB)"
+        )
+
     if not matches:
         return f'{{"result": "No matches found for pattern: {pattern}"}}'
 
-    # Limit results
-    if len(matches) > 50:
-        matches = matches[:50] + [f"... ({len(matches) - 50} more matches)"]
+    # Limit results (the scan stopped just past the cap)
+    if len(matches) > SEARCH_MATCH_CAP:
+        matches = matches[:SEARCH_MATCH_CAP] + [
+            f"... (more than {SEARCH_MATCH_CAP} matches; narrow the pattern)"
+        ]
 
     return "=== SEARCH RESULTS ===\n" + "\n".join(matches)
 
 
-@tool("list_tasks_in_sheet")
 def list_tasks_in_sheet(sheet_url: str) -> str:
     """
     List all available tasks in the Google Sheet. Use this to find valid task IDs
@@ -233,45 +461,64 @@ def list_tasks_in_sheet(sheet_url: str) -> str:
       "sheet_url": "<string>"
     }
     """
-    reader = SheetTaskReader(credentials_path=get_credentials_path())
-    tasks = reader.get_all_tasks(sheet_url)
-    
+    tasks = _all_sheet_tasks(sheet_url)
+
     if not tasks:
         return '{"result": "NO_TASKS found in sheet"}'
-    
-    task_list = []
-    for t in tasks:
-        task_list.append(f"- {t.task_id}: {t.title} (assignee: {t.assignee}, status: {t.status})")
-    
-    return "=== AVAILABLE TASKS ===\n" + "\n".join(task_list)
+
+    task_list = [
+        {"task_id": t.task_id, "title": t.title, "assignee": t.assignee, "status": t.status}
+        for t in tasks
+    ]
+    return "=== AVAILABLE TASKS ===\n" + json.dumps(task_list, ensure_ascii=False, indent=2)
 
 
 # === Crew Builder ===
 
-def _make_llm(model: str = "llama3") -> LLM:
-    """Create the shared CrewAI LLM that talks to Ollama."""
+@functools.lru_cache(maxsize=4)
+def _make_llm(model: str = "llama3") -> "LLM":
+    """
+    Create the shared CrewAI LLM that talks to Ollama. One instance per
+    model (memoized) so every agent — and repeated crews in one process —
+    reuse the same client and its HTTP connection pool instead of
+    re-handshaking per agent turn.
+    """
+    from crewai import LLM
+
+    # Hint to Ollama to keep the model resident across agent turns.
+    os.environ.setdefault("OLLAMA_KEEP_ALIVE", "10m")
     # CrewAI expects the model name as "ollama/<model_name>"
     return LLM(model=f"ollama/{model}")
 
 
 def build_crew(
-    task_id: str,
-    sheet_url: str,
-    codebase_root: str | Path,
     *,
     model: str = "llama3",
     verbose: bool = False,
-) -> Crew:
+) -> "Crew":
     """
     Build a Crew that runs the end-to-end onboarding flow for a task.
-    
+    Task descriptions use {task_id}/{sheet_url}/{codebase_root}
+    placeholders filled in from kickoff inputs, so one built crew is
+    reusable across tasks (see run_crew_for_task).
+
     Key Agentic Features:
     - Dynamic Tool Usage: Parser and Reasoning agents can read files and search code
     - verbose: If True, shows detailed debug output. If False, minimal output for users.
     - Caching: Index caching to avoid repeated scans
     """
+    from crewai import Agent, Crew, Task
+    from crewai.tools import tool
+
+    # The plain tool functions above are wrapped here so importing this
+    # module (or calling a tool directly) never pays the CrewAI import.
+    get_task_from_sheet_tool = tool("get_task_from_sheet")(get_task_from_sheet)
+    list_tasks_in_sheet_tool = tool("list_tasks_in_sheet")(list_tasks_in_sheet)
+    index_codebase_tool = tool("index_codebase")(index_codebase)
+    read_file_tool = tool("read_file")(read_file)
+    search_codebase_tool = tool("search_codebase")(search_codebase)
+
     llm = _make_llm(model=model)
-    codebase_root_str = str(Path(codebase_root).resolve())
 
     # === Sheet Agent ===
     sheet_agent = Agent(
@@ -295,7 +542,7 @@ def build_crew(
             "Your output must be factual, concise, and based only on sheet data."
         ),
 
-        tools=[get_task_from_sheet, list_tasks_in_sheet],
+        tools=[get_task_from_sheet_tool, list_tasks_in_sheet_tool],
         llm=llm,
         verbose=verbose,
     )
@@ -324,7 +571,7 @@ def build_crew(
             "reason why each file might be relevant to the task."
         ),
 
-        tools=[index_codebase, read_file, search_codebase],
+        tools=[index_codebase_tool, read_file_tool, search_codebase_tool],
         llm=llm,
         verbose=verbose,
     )
@@ -376,7 +623,7 @@ def build_crew(
             "Your goal is correctness and safety, NOT task completion at all costs."
         ),
 
-        tools=[read_file, search_codebase],
+        tools=[read_file_tool, search_codebase_tool],
         llm=llm,
         verbose=verbose,
         max_iter=8,
@@ -410,7 +657,7 @@ def build_crew(
             "Your goal is to improve accuracy and clarity, not to expand scope."
         ),
 
-        tools=[read_file, search_codebase],
+        tools=[read_file_tool, search_codebase_tool],
         llm=llm,
         verbose=verbose,
         max_iter=6,
@@ -419,27 +666,29 @@ def build_crew(
     # Task 1: Fetch task
     fetch_task = Task(
         description=(
-            f"Use the get_task_from_sheet tool to fetch full details for task_id "
-            f"'{task_id}' from sheet '{sheet_url}'. Return them clearly.\n\n"
+            "Use the get_task_from_sheet tool to fetch full details for task_id "
+            "'{task_id}' from sheet '{sheet_url}'. Return them clearly.\n\n"
             "If the tool returns an error (task not found), use list_tasks_in_sheet "
             "to see available task IDs and report which ones exist."
         ),
         agent=sheet_agent,
         expected_output="The task details (id, assignee, title, description, status) or an error message.",
         max_retries=1,
+        # No dependency on the parser task; runs concurrently with it.
+        async_execution=True,
     )
 
     # Task 2: Index the codebase (with caching)
     index_codebase_task = Task(
         description=(
-            f"You are working on task '{task_id}'. "
-            f"Use the index_codebase tool to analyze the codebase at '{codebase_root_str}'. "
-            f"Call it with: {{\"root\": \"{codebase_root_str}\", \"use_cache\": true}}\n\n"
-            f"After getting the summary, identify which files are relevant to THIS specific task. "
-            f"Base your file selection on the task title and description from the previous step — "
-            f"do NOT default to generic patterns like 'login' or 'auth' unless the task is actually about those. "
-            f"If you need to search for patterns, use search_codebase with root='{codebase_root_str}' "
-            f"and a pattern derived from the actual task description."
+            "You are working on task '{task_id}'. "
+            "Use the index_codebase tool to analyze the codebase at '{codebase_root}'. "
+            "Call it with: {\"root\": \"{codebase_root}\", \"use_cache\": true}\n\n"
+            "After getting the summary, identify which files are relevant to THIS specific task. "
+            "Base your file selection on the task title and description available in your context — "
+            "do NOT default to generic patterns like 'login' or 'auth' unless the task is actually about those. "
+            "If you need to search for patterns, use search_codebase with root='{codebase_root}' "
+            "and a pattern derived from the actual task description."
         ),
         agent=parser_agent,
         # expected_output=(
@@ -457,28 +706,30 @@ def build_crew(
             "Do NOT include explanations in this section."
         ),
         max_retries=1,
+        # Independent of the sheet fetch; runs concurrently with it.
+        async_execution=True,
     )
 
     # Task 3: Read key files for context 
     read_relevant_files_task = Task(
         description=(
-            f"You are working on task '{task_id}'. "
-            f"The previous task MUST have produced a list of real file paths from the codebase at "
-            f"'{codebase_root_str}'.\n\n"
-
-            f"Your job:\n"
-            f"- Look ONLY at the file paths explicitly listed in the previous task output.\n"
-            f"- Select the files most relevant to the task description.\n\n"
-
-            f"Tool usage rules:\n"
-            f"- Call read_file using EXACT paths copied verbatim from the previous task output.\n"
-            f"- Do NOT invent, infer, or guess file paths.\n"
-            f"- Do NOT use example or placeholder paths.\n"
-            f"- Try each file at most ONCE. If not found, move on immediately.\n\n"
-
-            f"Failure handling:\n"
-            f"- If the previous task output does NOT contain a clear file list, explicitly say:\n"
-            f"  'No file list was provided by the Parser Agent. Cannot proceed.' and STOP."
+            "You are working on task '{task_id}'. "
+            "The previous task MUST have produced a list of real file paths from the codebase at "
+            "'{codebase_root}'.\n\n"
+
+            "Your job:\n"
+            "- Look ONLY at the file paths explicitly listed in the previous task output.\n"
+            "- Select the files most relevant to the task description.\n\n"
+
+            "Tool usage rules:\n"
+            "- Call read_file using EXACT paths copied verbatim from the previous task output.\n"
+            "- Do NOT invent, infer, or guess file paths.\n"
+            "- Do NOT use example or placeholder paths.\n"
+            "- Try each file at most ONCE. If not found, move on immediately.\n\n"
+
+            "Failure handling:\n"
+            "- If the previous task output does NOT contain a clear file list, explicitly say:\n"
+            "  'No file list was provided by the Parser Agent. Cannot proceed.' and STOP."
         ),
         agent=reasoning_agent,
         expected_output=(
@@ -486,17 +737,19 @@ def build_crew(
             "each with a brief summary of relevant contents."
         ),
         max_retries=1,
+        # Awaits both async tasks before running.
+        context=[fetch_task, index_codebase_task],
     )
 
     # Task 4: Plan the task
     plan_tasks_task = Task(
         description=(
-            f"You are working on task '{task_id}'. "
-            f"Using the task title and description from Task 1, the codebase structure from Task 2, "
-            f"and the file contents from Task 3, PLAN the exact implementation steps to complete THIS task. "
-            f"Do NOT re-discover files — use only what was already found. "
-            f"Do NOT default to generic steps — every step must be specific to the actual task description. "
-            f"Be precise about what change is needed in each file and why."
+            "You are working on task '{task_id}'. "
+            "Using the task title and description from Task 1, the codebase structure from Task 2, "
+            "and the file contents from Task 3, PLAN the exact implementation steps to complete THIS task. "
+            "Do NOT re-discover files — use only what was already found. "
+            "Do NOT default to generic steps — every step must be specific to the actual task description. "
+            "Be precise about what change is needed in each file and why."
         ),
         agent=reasoning_agent,
         expected_output=(
@@ -504,6 +757,7 @@ def build_crew(
             "each referencing an actual file and describing exactly what needs to be changed or added."
         ),
         max_retries=1,
+        context=[fetch_task, index_codebase_task, read_relevant_files_task],
     )
 
     # Task 5: Generate detailed guide
@@ -526,13 +780,13 @@ def build_crew(
     # Task 6: Verify the guide
     verify_guide_task = Task(
         description=(
-            f"Critically review the generated guide. Identify any missing steps, "
-            f"incorrect assumptions, or references to non-existent files.\n\n"
-            f"If you need to verify a file exists, use read_file — but ONLY with file paths "
-            f"that were explicitly listed in the guide from the previous task. "
-            f"Do NOT invent or guess file paths. "
-            f"If you need to search, use search_codebase tool with root='{codebase_root_str}'.\n\n"
-            f"If needed, provide an improved or annotated version of the guide."
+            "Critically review the generated guide. Identify any missing steps, "
+            "incorrect assumptions, or references to non-existent files.\n\n"
+            "If you need to verify a file exists, use read_file — but ONLY with file paths "
+            "that were explicitly listed in the guide from the previous task. "
+            "Do NOT invent or guess file paths. "
+            "If you need to search, use search_codebase tool with root='{codebase_root}'.\n\n"
+            "If needed, provide an improved or annotated version of the guide."
         ),
         agent=verification_agent,
         expected_output=(
@@ -552,6 +806,12 @@ def build_crew(
     return crew
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_crew(model: str, verbose: bool) -> "Crew":
+    """One built crew per (model, verbose); task values come from kickoff inputs."""
+    return build_crew(model=model, verbose=verbose)
+
+
 def run_crew_for_task(
     task_id: str,
     sheet_url: str,
@@ -566,14 +826,10 @@ def run_crew_for_task(
     Args:
         verbose: If True, shows detailed debug output. If False, minimal output.
     """
-    crew = build_crew(
-        task_id=task_id,
-        sheet_url=sheet_url,
-        codebase_root=codebase_root,
-        model=model,
-        verbose=verbose,
-    )
-    # Pass inputs to all tasks so agents know the actual values
+    crew = _cached_crew(model, verbose)
+    # Task descriptions carry {task_id}/{sheet_url}/{codebase_root}
+    # placeholders that CrewAI fills in from these inputs, so the built
+    # crew (agents, prompts, LLM wiring) is reused across invocations.
     inputs = {
         "task_id": task_id,
         "sheet_url": sheet_url,
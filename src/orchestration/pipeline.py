@@ -1,11 +1,27 @@
 """
 End-to-end pipeline: fetch task from sheet → index codebase → generate guide with Ollama.
+The sheet fetch, codebase scan, and Ollama model load have no data
+dependencies, so they run concurrently; wall time is their max, not their sum.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
+def _warm_ollama_model(model: str, host: str | None) -> None:
+    """Trigger the model load in Ollama so it's resident before the real call."""
+    try:
+        if host:
+            from ollama import Client
+            Client(host=host).generate(model=model, prompt="", keep_alive="30m")
+        else:
+            import ollama
+            ollama.generate(model=model, prompt="", keep_alive="30m")
+    except Exception:
+        pass  # Warm-up is best-effort; the real call reports errors.
+
+
 @dataclass
 class PipelineResult:
     """Result of the full onboarding pipeline."""
@@ -28,9 +44,13 @@ def run_pipeline(
     ollama_model: str = "llama3",
     ollama_host: str | None = None,
     max_index_files: int = 300,
+    stream: bool = False,
+    guide_cache_dir: str | Path | None = None,
 ) -> PipelineResult:
     """
     Run the full flow: load task from sheet → build codebase index → call Ollama → return guide.
+    With stream=True the guide is printed token-by-token while it generates.
+    guide_cache_dir enables the on-disk LLM response cache (see generate_task_guide).
     """
     from src.sheet_reader.config import get_credentials_path
     from src.sheet_reader.reader import SheetTaskReader
@@ -41,35 +61,45 @@ def run_pipeline(
     root = Path(codebase_root).resolve()
     creds = Path(credentials_path) if credentials_path else get_credentials_path(root)
 
-    # 1. Fetch task from sheet
-    reader = SheetTaskReader(credentials_path=creds)
-    try:
-        task = reader.get_task_by_id(sheet_url, task_id, worksheet_index)
-    except Exception as e:
-        return PipelineResult(
-            task_id=task_id,
-            task_title="",
-            task_description="",
-            error=f"Failed to load task from sheet: {e}",
-        )
-    if not task:
+    if not root.is_dir():
         return PipelineResult(
             task_id=task_id,
             task_title="",
             task_description="",
-            error=f"Task '{task_id}' not found in sheet.",
-        )
-
-    # 2. Build codebase index
-    if not root.is_dir():
-        return PipelineResult(
-            task_id=task_id,
-            task_title=task.title,
-            task_description=task.description,
             error=f"Codebase root is not a directory: {root}",
         )
-    files = scan_project(root)
-    index = build_index(files)
+
+    # 1+2. Fetch task, build index, and warm the model concurrently.
+    reader = SheetTaskReader(credentials_path=creds)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_task = ex.submit(reader.get_task_by_id, sheet_url, task_id, worksheet_index)
+        f_index = ex.submit(lambda: build_index(scan_project(root, max_detailed=max_index_files)))
+        ex.submit(_warm_ollama_model, ollama_model, ollama_host)
+        try:
+            task = f_task.result()
+        except Exception as e:
+            return PipelineResult(
+                task_id=task_id,
+                task_title="",
+                task_description="",
+                error=f"Failed to load task from sheet: {e}",
+            )
+        if not task:
+            return PipelineResult(
+                task_id=task_id,
+                task_title="",
+                task_description="",
+                error=f"Task '{task_id}' not found in sheet.",
+            )
+        try:
+            index = f_index.result()
+        except Exception as e:
+            return PipelineResult(
+                task_id=task_id,
+                task_title=task.title,
+                task_description=task.description,
+                error=f"Failed to index codebase: {e}",
+            )
     codebase_text = format_index_for_llm(index, max_files=max_index_files)
 
     # 3. Generate guide with Ollama
@@ -80,6 +110,8 @@ def run_pipeline(
             codebase_index_text=codebase_text,
             model=ollama_model,
             ollama_host=ollama_host,
+            stream=stream,
+            cache_dir=guide_cache_dir,
         )
     except Exception as e:
         return PipelineResult(
@@ -17,13 +17,14 @@ def main() -> None:
     ap.add_argument("--output", "-o", help="Write index JSON to file")
     ap.add_argument("--llm", action="store_true", help="Print LLM-formatted summary to stdout")
     ap.add_argument("--max-files", type=int, default=500, help="Max files in LLM summary")
+    ap.add_argument("--no-collapse", action="store_true", help="Don't merge single-child directory chains in the tree")
     args = ap.parse_args()
     root = Path(args.root).resolve()
     if not root.is_dir():
         print(f"Error: not a directory: {root}")
         return
     files = scan_project(root)
-    index = build_index(files)
+    index = build_index(files, collapse_tree=not args.no_collapse)
     if args.output:
         out_path = Path(args.output)
         out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,89 @@
+"""
+Persistent per-file cache for incremental indexing.
+Keyed by (mtime_ns, size) per file, with a content-hash fallback so files
+touched but not changed (e.g. by checkouts) still count as hits.
+Only cache misses are re-parsed; entries for deleted files are pruned.
+"""
+
+import mmap
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+
+from .scanner import FileInfo
+
+try:
+    import xxhash
+
+    def hash_bytes(data: bytes) -> int:
+        """Fast non-cryptographic 64-bit hash for cache keys."""
+        return xxhash.xxh3_64(data).intdigest()
+except ImportError:
+    # xxhash is optional; blake2b is the fastest stdlib hash for this.
+    import hashlib
+
+    def hash_bytes(data: bytes) -> int:
+        """Fast non-cryptographic 64-bit hash for cache keys."""
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+# Bump to invalidate existing caches when the entry schema changes.
+CACHE_VERSION = 4
+CACHE_FILENAME = "index.bin"
+
+
+@dataclass
+class IndexEntry:
+    """One cached file: its stat key, content hash, and parsed metadata."""
+    path: str  # relative path (cache key)
+    mtime_ns: int
+    size: int
+    content_hash: int
+    parsed: FileInfo
+
+
+# Above this size, hash through mmap so the OS pages content on demand
+# instead of us copying the whole file onto the heap.
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def hash_file(path: str | Path) -> int | None:
+    """Content hash used as the second-tier cache check."""
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > _MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hash_bytes(mm)
+            return hash_bytes(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def load_cache(cache_dir: Path) -> dict[str, IndexEntry]:
+    """Load cached entries; returns {} on missing/corrupt/outdated cache."""
+    cache_path = Path(cache_dir) / CACHE_FILENAME
+    try:
+        with open(cache_path, "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_cache(cache_dir: Path, entries: dict[str, IndexEntry]) -> None:
+    """Write entries to disk; caching is best-effort, failures are ignored."""
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so an interrupted write never leaves a corrupt
+        # cache behind.
+        tmp_path = cache_dir / (CACHE_FILENAME + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": CACHE_VERSION, "entries": entries}, f)
+        os.replace(tmp_path, cache_dir / CACHE_FILENAME)
+    except Exception:
+        pass
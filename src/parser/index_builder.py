@@ -2,30 +2,48 @@
 Builds a structured index and LLM-friendly summary from scan results.
 """
 
+import io
+import sys
+
 from .scanner import FileInfo
 
 
-def build_index(files: list[FileInfo]) -> dict:
+def build_index(
+    files: list[FileInfo],
+    collapse_tree: bool = True,
+    llm_text: bool = False,
+    max_files: int = 500,
+    max_chars: int = 32000,
+) -> dict | str:
     """
     Build a structured index: file tree (text), file list with metadata,
     and by-extension grouping for retrieval.
+    collapse_tree merges single-subdirectory chains (src -> src/crew) so the
+    rendered tree spends fewer tokens on directories that add no structure.
+    With llm_text=True the LLM summary string is produced directly in one
+    pass — no intermediate per-file dicts — for callers that only feed the
+    model (max_files/max_chars apply as in format_index_for_llm).
     """
-    tree = _build_tree(files)
+    if llm_text:
+        return _format_direct(files, collapse_tree, max_files, max_chars)
+    tree = _build_tree(files, collapse=collapse_tree)
     by_ext: dict[str, list[str]] = {}
     file_list = []
     for f in files:
+        # Intern the values repeated across many files (extensions, hints)
+        # so large indexes share one string object per distinct value.
         file_entry = {
             "path": f.relative_path,
-            "ext": f.extension,
+            "ext": sys.intern(f.extension) if f.extension else "",
             "lines": f.line_count,
-            "language": f.language_hint,
+            "language": sys.intern(f.language_hint) if f.language_hint else "",
             # New enhanced fields
-            "role": f.role_hint,
-            "framework": f.framework_hint,
+            "role": sys.intern(f.role_hint) if f.role_hint else "",
+            "framework": sys.intern(f.framework_hint) if f.framework_hint else "",
             "symbols": f.top_level_symbols,
         }
         file_list.append(file_entry)
-        key = f.extension or "(no ext)"
+        key = sys.intern(f.extension) if f.extension else "(no ext)"
         if key not in by_ext:
             by_ext[key] = []
         by_ext[key].append(f.relative_path)
@@ -37,87 +55,150 @@ def build_index(files: list[FileInfo]) -> dict:
     }
 
 
-def _build_tree(files: list[FileInfo]) -> str:
-    """Produce a simple ASCII file tree (directories and files)."""
-    root: dict = {}
+def _build_tree(files: list[FileInfo], collapse: bool = True) -> str:
+    """
+    Produce a simple ASCII file tree (directories and files).
+    One pass over the (already sorted) paths builds a flat
+    parent -> children map — no nested dict per directory — and
+    single-subdirectory chains are merged into 'a/b' labels during emit.
+    """
+    children: dict[str, list[tuple[str, bool]]] = {"": []}
     for f in files:
         parts = f.relative_path.replace("\\", "/").split("/")
-        node = root
+        parent = ""
         for i, name in enumerate(parts):
-            is_file = i == len(parts) - 1
-            if name not in node:
-                node[name] = {} if not is_file else None
-            if not is_file:
-                node = node[name]
+            if i == len(parts) - 1:
+                children[parent].append((name, False))
+            else:
+                rel = f"{parent}/{name}" if parent else name
+                if rel not in children:
+                    children[rel] = []
+                    children[parent].append((name, True))
+                parent = rel
     lines: list[str] = []
 
-    def walk(d: dict, prefix: str) -> None:
-        keys = sorted(d.keys())
-        for i, k in enumerate(keys):
-            last = i == len(keys) - 1
+    def walk(rel: str, prefix: str) -> None:
+        kids = sorted(children[rel])
+        for i, (name, is_dir) in enumerate(kids):
+            last = i == len(kids) - 1
             branch = "└── " if last else "├── "
-            child = d[k]
-            if child is None:
-                lines.append(prefix + branch + k)
-            else:
-                lines.append(prefix + branch + k + "/")
-                ext = "    " if last else "│   "
-                walk(child, prefix + ext)
+            if not is_dir:
+                lines.append(prefix + branch + name)
+                continue
+            child_rel = f"{rel}/{name}" if rel else name
+            label = name
+            while collapse:
+                grandkids = children[child_rel]
+                if len(grandkids) != 1 or not grandkids[0][1]:
+                    break
+                only = grandkids[0][0]
+                child_rel = f"{child_rel}/{only}"
+                label = f"{label}/{only}"
+            lines.append(prefix + branch + label + "/")
+            walk(child_rel, prefix + ("    " if last else "│   "))
 
-    walk(root, "")
+    walk("", "")
     return "\n".join(lines) if lines else "(no files)"
 
 
-def format_index_for_llm(index: dict, max_files: int = 500) -> str:
+def _file_row(path: str, lang_or_ext: str, lines, role: str, framework: str, symbols) -> str:
+    """One '- path [lang] (N lines) [meta]' row, shared by both formatters."""
+    line_info = f" ({lines} lines)" if lines else ""
+    # Build metadata string
+    meta_parts = []
+    if role and role != "generic":
+        meta_parts.append(f"role:{role}")
+    if framework:
+        meta_parts.append(f"framework:{framework}")
+    if symbols:
+        symbol_str = ", ".join(symbols[:5])
+        if len(symbols) > 5:
+            symbol_str += "..."
+        meta_parts.append(f"exports:{symbol_str}")
+    meta_str = f" [{', '.join(meta_parts)}]" if meta_parts else ""
+    return f"\n- {path} [{lang_or_ext}]{line_info}{meta_str}"
+
+
+def _write_by_extension(buf: io.StringIO, by_ext: dict) -> None:
+    buf.write("\n\n## By extension (for retrieval)")
+    for ext, paths in sorted(by_ext.items()):
+        count = len(paths)
+        sample = paths[:10] if count > 10 else paths
+        sample_str = ", ".join(sample)
+        if count > 10:
+            sample_str += f" ... (+{count - 10} more)"
+        buf.write(f"\n- {ext}: {sample_str}")
+
+
+def _format_direct(files: list[FileInfo], collapse: bool, max_files: int, max_chars: int) -> str:
+    """
+    Render the LLM summary straight from the FileInfo list in one pass,
+    skipping the intermediate per-file dicts of the structured index.
+    """
+    buf = io.StringIO()
+    buf.write("# Codebase structure\n\n## File tree\n```\n")
+    buf.write(_build_tree(files, collapse=collapse))
+    buf.write(f"\n```\n\n## File list (total: {len(files)} files)\n")
+    shown_limit = len(files)
+    if len(files) > max_files:
+        shown_limit = max_files
+        buf.write(f"\n(Showing first {max_files} files; total {len(files)})\n")
+    budget = max_chars - buf.tell() - 1
+    stopped = False
+    by_ext: dict[str, list[str]] = {}
+    for i, f in enumerate(files):
+        key = f.extension or "(no ext)"
+        by_ext.setdefault(key, []).append(f.relative_path)
+        if i >= shown_limit or stopped:
+            continue
+        if budget <= 0:
+            stopped = True
+            buf.write(f"\n(... truncated to fit context budget; {shown_limit - i} more files)")
+            continue
+        row = _file_row(
+            f.relative_path,
+            f.language_hint or f.extension,
+            f.line_count,
+            f.role_hint,
+            f.framework_hint,
+            f.top_level_symbols,
+        )
+        buf.write(row)
+        budget -= len(row)
+    _write_by_extension(buf, by_ext)
+    return buf.getvalue()
+
+
+def format_index_for_llm(index: dict, max_files: int = 500, max_chars: int = 32000) -> str:
     """
     Format the index as a single text block for LLM context.
-    Truncate file list if too long.
+    Truncate the file list if too long, and stop adding file lines once the
+    output reaches max_chars (~8K tokens) so prefill cost stays bounded.
+    Writes into one StringIO instead of accumulating a list of interim
+    strings and joining at the end.
     """
-    parts = [
-        "# Codebase structure",
-        "",
-        "## File tree",
-        "```",
-        index["file_tree"],
-        "```",
-        "",
-        f"## File list (total: {index['total_files']} files)",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write("# Codebase structure\n\n## File tree\n```\n")
+    buf.write(index["file_tree"])
+    buf.write(f"\n```\n\n## File list (total: {index['total_files']} files)\n")
     files = index["files"]
     if len(files) > max_files:
         files = files[:max_files]
-        parts.append(f"(Showing first {max_files} files; total {index['total_files']})")
-        parts.append("")
-    for f in files:
-        line_info = f" ({f['lines']} lines)" if f.get("lines") else ""
-        # Add enhanced metadata
-        role = f.get("role", "")
-        framework = f.get("framework", "")
-        symbols = f.get("symbols", [])
-        
-        # Build metadata string
-        meta_parts = []
-        if role and role != "generic":
-            meta_parts.append(f"role:{role}")
-        if framework:
-            meta_parts.append(f"framework:{framework}")
-        if symbols:
-            symbol_str = ", ".join(symbols[:5])
-            if len(symbols) > 5:
-                symbol_str += "..."
-            meta_parts.append(f"exports:{symbol_str}")
-        
-        meta_str = f" [{', '.join(meta_parts)}]" if meta_parts else ""
-        
-        parts.append(f"- {f['path']} [{f['language'] or f['ext']}]{line_info}{meta_str}")
-    parts.append("")
-    parts.append("## By extension (for retrieval)")
-    for ext, paths in sorted(index["by_extension"].items()):
-        count = len(paths)
-        sample = paths[:10] if count > 10 else paths
-        sample_str = ", ".join(sample)
-        if count > 10:
-            sample_str += f" ... (+{count - 10} more)"
-        parts.append(f"- {ext}: {sample_str}")
-    return "\n".join(parts)
+        buf.write(f"\n(Showing first {max_files} files; total {index['total_files']})\n")
+    budget = max_chars - buf.tell() - 1
+    for shown, f in enumerate(files):
+        if budget <= 0:
+            buf.write(f"\n(... truncated to fit context budget; {len(files) - shown} more files)")
+            break
+        file_line = _file_row(
+            f["path"],
+            f["language"] or f["ext"],
+            f.get("lines"),
+            f.get("role", ""),
+            f.get("framework", ""),
+            f.get("symbols", []),
+        )
+        buf.write(file_line)
+        budget -= len(file_line)
+    _write_by_extension(buf, index["by_extension"])
+    return buf.getvalue()
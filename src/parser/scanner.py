@@ -3,11 +3,17 @@ Scans a project directory and collects file metadata.
 Uses ignore patterns so we don't index node_modules, .git, venv, etc.
 """
 
+import functools
+import os
 import re
+import sys
+from fnmatch import translate
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Iterator
 
+from .semantic import extract_signatures
+
 # Default ignore patterns (gitignore-style)
 DEFAULT_IGNORE = [
     "node_modules",
@@ -28,10 +34,11 @@ DEFAULT_IGNORE = [
     ".mypy_cache",
     "*.min.js",
     "*.min.css",
+    ".onboard-cache",
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     path: str
     relative_path: str
@@ -40,17 +47,18 @@ class FileInfo:
     line_count: int | None = None
     language_hint: str = ""
     # New fields for enhanced indexing
-    top_level_symbols: list[str] = None  # function/class names
+    top_level_symbols: list[str] = field(default_factory=list)  # signatures
     role_hint: str = ""  # entrypoint, api_handler, component, service, config
     framework_hint: str = ""  # react, express, django, etc.
-    
-    def __post_init__(self):
-        if self.top_level_symbols is None:
-            self.top_level_symbols = []
 
 
-def _matches_ignore(relative_path: str, ignore_patterns: list[str]) -> bool:
-    parts = relative_path.replace("\\", "/").split("/")
+def _matches_ignore(
+    relative_path: str,
+    ignore_patterns: list[str],
+    parts: tuple[str, ...] | None = None,
+) -> bool:
+    if parts is None:
+        parts = relative_path.replace("\\", "/").split("/")
     for pattern in ignore_patterns:
         if not pattern.strip():
             continue
@@ -63,72 +71,327 @@ def _matches_ignore(relative_path: str, ignore_patterns: list[str]) -> bool:
     return False
 
 
-def _count_lines(path: Path, max_read: int = 5000) -> int | None:
-    """Count lines in file; cap read for large files."""
+@dataclass(frozen=True, slots=True)
+class ScanSpec:
+    """
+    Precompiled scan configuration for one ignore-pattern set: exact
+    component names (set lookup), '*.ext' suffixes (C-level endswith),
+    literal paths such as 'docs/build' (relative-path prefix match), and
+    other globs compiled into a single alternation regex. Built once per
+    pattern set and reusable across scans of the same project.
+    """
+    ignore_patterns: tuple[str, ...]
+    component_names: frozenset[str]
+    suffixes: tuple[str, ...]
+    glob_re: re.Pattern | None
+    path_prefixes: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_spec(patterns: tuple[str, ...]) -> ScanSpec:
+    """Classify ignore patterns once per pattern set."""
+    names: set[str] = set()
+    suffixes: list[str] = []
+    globs: list[str] = []
+    path_prefixes: list[str] = []
+    for p in patterns:
+        p = p.strip()
+        if not p:
+            continue
+        if p.startswith("*."):
+            suffixes.append(p[1:])
+        elif "*" in p:
+            globs.append(translate(p))
+        elif "/" in p:
+            path_prefixes.append(p.rstrip("/"))
+        else:
+            names.add(p)
+    return ScanSpec(
+        ignore_patterns=patterns,
+        component_names=frozenset(names),
+        suffixes=tuple(suffixes),
+        glob_re=re.compile("|".join(globs)) if globs else None,
+        path_prefixes=tuple(path_prefixes),
+    )
+
+
+def _iter_candidate_files(
+    root: Path,
+    spec: ScanSpec,
+    include_hidden: bool,
+) -> Iterator[tuple[str, str, os.stat_result]]:
+    """
+    Yield (path, relative_path, stat) for files that pass the ignore filter.
+    Prunes ignored directories before descending so huge vendored trees
+    (node_modules, .venv, .git, ...) are never walked at all. Negated
+    patterns ("!foo") can re-include pruned subtrees, so fall back to the
+    full walk when any are present.
+    """
+    ignore = list(spec.ignore_patterns)
+    if any(p.strip().startswith("!") for p in ignore):
+        for path in root.rglob("*"):
+            if not path.is_file():
+                continue
+            try:
+                rel = path.relative_to(root)
+                rel_str = str(rel).replace("\\", "/")
+            except ValueError:
+                continue
+            if not include_hidden and any(p.startswith(".") for p in rel.parts):
+                continue
+            # Reuse the components pathlib already split.
+            if _matches_ignore(rel_str, ignore, rel.parts):
+                continue
+            try:
+                yield str(path), rel_str, path.stat()
+            except OSError:
+                continue
+        return
+    names, suffixes, glob_re, path_prefixes = (
+        spec.component_names,
+        spec.suffixes,
+        spec.glob_re,
+        spec.path_prefixes,
+    )
+
+    def ignored(component: str) -> bool:
+        return (
+            component in names
+            or (bool(suffixes) and component.endswith(suffixes))
+            or (glob_re is not None and glob_re.match(component) is not None)
+        )
+
+    def path_ignored(rel: str) -> bool:
+        return any(rel == p or rel.startswith(p + "/") for p in path_prefixes)
+
+    # Manual scandir recursion: ignored directories are skipped before
+    # descent, relative paths are built incrementally (no relpath call per
+    # directory), and entries carry their d_type so no extra stat is needed
+    # to tell files from directories.
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not include_hidden and name.startswith("."):
+                    continue
+                if ignored(name):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if path_prefixes and path_ignored(f"{rel_prefix}{name}"):
+                        continue
+                    stack.append((entry.path, f"{rel_prefix}{name}/"))
+                elif entry.is_file():
+                    if path_prefixes and path_ignored(f"{rel_prefix}{name}"):
+                        continue
+                    try:
+                        # Served from the directory entry read just above —
+                        # no second stat syscall per file.
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, f"{rel_prefix}{name}", st
+
+
+# Cap on how much of a file the metadata pass reads (line count + symbols).
+_MAX_ANALYZE_BYTES = 4 * 1024 * 1024
+
+
+def _read_and_analyze(path: str, ext: str, size: int) -> tuple[int | None, list[str]]:
+    """
+    One open per file serving both metadata needs: newlines are counted in
+    a C-level bytes scan and the same buffer is decoded for signature
+    extraction when the file qualifies.
+    """
+    want_symbols = ext in _SYMBOL_SCAN_EXTS and size <= MAX_SYMBOL_SCAN_BYTES
     try:
-        with open(path, "rb") as f:
-            count = 0
-            for _ in f:
-                count += 1
-                if count >= max_read:
-                    return None  # large file, skip exact count
-            return count
-    except Exception:
-        return None
+        # Unbuffered: the walk already proved this is a regular file, we do
+        # exactly one read, and skipping BufferedReader drops its extra
+        # per-open syscalls.
+        with open(path, "rb", buffering=0) as f:
+            data = f.read(_MAX_ANALYZE_BYTES + 1)
+    except OSError:
+        return None, []
+    if len(data) > _MAX_ANALYZE_BYTES:
+        line_count = None  # large file, skip exact count
+    else:
+        line_count = data.count(b"\n") + (0 if not data or data.endswith(b"\n") else 1)
+    symbols: list[str] = []
+    if want_symbols:
+        symbols = extract_signatures(data.decode("utf-8", "ignore"), ext)
+    return line_count, symbols
 
 
 def scan_project(
     root: str | Path,
     ignore_patterns: list[str] | None = None,
     include_hidden: bool = False,
+    cache_dir: str | Path | None = None,
+    max_detailed: int | None = None,
+    spec: ScanSpec | None = None,
+    include_exts: set[str] | None = None,
 ) -> list[FileInfo]:
     """
     Walk the project tree and collect FileInfo for each file.
+    If cache_dir is given, unchanged files (same mtime+size, or same content
+    hash) reuse their cached metadata instead of being re-parsed.
+    max_detailed bounds how many files (in path order) get the file-reading
+    metadata pass (line counts, symbols); the rest keep stat-level info
+    only — pointless work when the LLM summary truncates the list anyway.
+    Callers scanning repeatedly can pass a prebuilt ScanSpec; otherwise one
+    is built (and memoized) from the ignore patterns.
+    include_exts restricts the scan to the given suffixes (e.g. {".py"}),
+    skipping binaries and other irrelevant files entirely.
     """
     root = Path(root).resolve()
     if not root.is_dir():
         raise NotADirectoryError(str(root))
-    ignore = ignore_patterns or DEFAULT_IGNORE
+    if spec is None:
+        spec = _scan_spec(tuple(ignore_patterns or DEFAULT_IGNORE))
+    # Imported here to avoid a circular import (cache stores FileInfo).
+    from .cache import IndexEntry, hash_file, load_cache, save_cache
+    cached = load_cache(Path(cache_dir)) if cache_dir is not None else None
+    fresh: dict[str, IndexEntry] = {}
+    dirty = False
     out: list[FileInfo] = []
+    # Cache misses to be parsed: (abs_path, rel_path, mtime_ns, size, content_hash)
+    misses: list[tuple[str, str, int, int, int]] = []
     try:
-        for path in root.rglob("*"):
-            if path.is_file():
-                try:
-                    rel = path.relative_to(root)
-                    rel_str = str(rel).replace("\\", "/")
-                except ValueError:
-                    continue
-                if not include_hidden and any(p.startswith(".") for p in rel.parts):
-                    continue
-                if _matches_ignore(rel_str, ignore):
-                    continue
-                ext = path.suffix.lower() if path.suffix else ""
-                size = path.stat().st_size
-                line_count = _count_lines(path)
-                lang = _extension_to_language(ext)
-                # Extract enhanced metadata
-                symbols = _extract_top_level_symbols(path)
-                role = _detect_role_hint(rel_str)
-                framework = _detect_framework_hint(rel_str)
-                
-                out.append(
-                    FileInfo(
-                        path=str(path),
-                        relative_path=rel_str,
-                        extension=ext,
-                        size_bytes=size,
-                        line_count=line_count,
-                        language_hint=lang,
-                        top_level_symbols=symbols,
-                        role_hint=role,
-                        framework_hint=framework,
-                    )
-                )
+        ext_filter = tuple(include_exts) if include_exts else None
+        for path_str, rel_str, st in _iter_candidate_files(root, spec, include_hidden):
+            if ext_filter is not None and not rel_str.endswith(ext_filter):
+                continue
+            # One interned object per relative path: the index, by-extension
+            # grouping, and cache entries all alias it rather than copies.
+            rel_str = sys.intern(rel_str)
+            if cached is not None:
+                entry = cached.get(rel_str)
+                if entry is not None:
+                    if (entry.mtime_ns, entry.size) == (st.st_mtime_ns, st.st_size):
+                        # Tier 1: stat key unchanged — trust the cached parse.
+                        fresh[rel_str] = entry
+                        out.append(entry.parsed)
+                        continue
+                    content_hash = hash_file(path_str)
+                    if content_hash is not None and entry.content_hash == content_hash:
+                        # Tier 2: touched but content identical — refresh stat key only.
+                        entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+                        fresh[rel_str] = entry
+                        dirty = True
+                        out.append(entry.parsed)
+                        continue
+                else:
+                    # New file: hashing is deferred until we know it lands in
+                    # the detailed (cached) set, so budget-excluded files are
+                    # never read at all.
+                    content_hash = None
+                dirty = True
+                misses.append((path_str, rel_str, st.st_mtime_ns, st.st_size, content_hash or 0))
+            else:
+                misses.append((path_str, rel_str, st.st_mtime_ns, st.st_size, 0))
     except PermissionError:
         pass
+    # Path order matches the truncation order of the LLM formatter, so the
+    # detailed budget goes to the files that can actually be shown.
+    misses.sort(key=lambda m: m[1])
+    if max_detailed is not None and len(misses) > max_detailed:
+        detailed, shallow = misses[:max_detailed], misses[max_detailed:]
+    else:
+        detailed, shallow = misses, []
+    for (path_str, rel_str, mtime_ns, size, content_hash), info in zip(detailed, _parse_files(detailed)):
+        out.append(info)
+        if cached is not None:
+            fresh[rel_str] = IndexEntry(
+                path=rel_str,
+                mtime_ns=mtime_ns,
+                size=size,
+                content_hash=content_hash or (hash_file(path_str) or 0),
+                parsed=info,
+            )
+    # Shallow entries are cheap to recompute, so they are not cached.
+    out.extend(_shallow_file_info(job) for job in shallow)
+    if cached is not None and (dirty or len(fresh) != len(cached)):
+        save_cache(Path(cache_dir), fresh)
     return sorted(out, key=lambda f: f.relative_path)
 
 
+# Below this many files, pool startup costs more than it saves.
+_PARALLEL_MIN_FILES = 50
+
+# Up to this many files the work is dominated by blocking reads (which
+# release the GIL), so cheap-to-start threads win; beyond it the regex/ast
+# CPU share amortizes process-pool startup.
+_PROCESS_POOL_MIN_FILES = 2000
+
+
+def _shallow_file_info(job: tuple[str, str, int, int, int]) -> FileInfo:
+    """Stat-level FileInfo without the file-reading metadata pass."""
+    path_str, rel_str, _mtime_ns, size, _content_hash = job
+    ext = os.path.splitext(rel_str)[1].lower()
+    ext = sys.intern(ext) if ext else ""
+    return FileInfo(
+        path=path_str,
+        relative_path=rel_str,
+        extension=ext,
+        size_bytes=size,
+        language_hint=_extension_to_language(ext),
+        role_hint=_detect_role_hint(rel_str),
+        framework_hint=_detect_framework_hint(rel_str),
+    )
+
+
+def _parse_file(job: tuple[str, str, int, int, int]) -> FileInfo:
+    """Parse one file into FileInfo. Pure per-file work, safe for workers."""
+    path_str, rel_str, _mtime_ns, size, _content_hash = job
+    # os.path string ops instead of a Path object per file on the hot path.
+    ext = os.path.splitext(rel_str)[1].lower()
+    # Interned: the same extension string recurs across most of the repo.
+    ext = sys.intern(ext) if ext else ""
+    line_count, symbols = _read_and_analyze(path_str, ext, size)
+    return FileInfo(
+        path=path_str,
+        relative_path=rel_str,
+        extension=ext,
+        size_bytes=size,
+        line_count=line_count,
+        language_hint=_extension_to_language(ext),
+        top_level_symbols=symbols,
+        role_hint=_detect_role_hint(rel_str),
+        framework_hint=_detect_framework_hint(rel_str),
+    )
+
+
+def _parse_files(jobs: list[tuple[str, str, int, int, int]]) -> list[FileInfo]:
+    """
+    Parse cache misses, fanning out to a pool when there are enough files
+    to amortize worker startup: threads for mid-size sets (overlapping
+    disk latency), processes for very large ones (CPU-bound parsing).
+    """
+    if len(jobs) < _PARALLEL_MIN_FILES:
+        return [_parse_file(job) for job in jobs]
+    if len(jobs) < _PROCESS_POOL_MIN_FILES:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_parse_file, jobs))
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (8 * workers))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_parse_file, jobs, chunksize=chunksize))
+    except OSError:
+        # e.g. fork/semaphore limits in restricted environments
+        return [_parse_file(job) for job in jobs]
+
+
 def _extension_to_language(ext: str) -> str:
     m = {
         ".py": "python",
@@ -150,98 +413,107 @@ def _extension_to_language(ext: str) -> str:
 
 # === Enhanced Indexing Functions ===
 
-def _extract_top_level_symbols(path: Path) -> list[str]:
-    """Extract top-level function and class names from a file using regex."""
-    ext = path.suffix.lower()
-    symbols = []
-    
-    try:
-        content = path.read_text(encoding='utf-8', errors='ignore')
-    except Exception:
-        return symbols
-    
-    if ext == ".py":
-        pattern = r'^(?:def|class)\s+(\w+)'
-        for line in content.splitlines():
-            match = re.match(pattern, line.strip())
-            if match:
-                symbols.append(match.group(1))
-    
-    elif ext in (".js", ".jsx", ".ts", ".tsx"):
-        patterns = [
-            r'^(?:export\s+)?function\s+(\w+)',
-            r'^(?:export\s+)?class\s+(\w+)',
-            r'^(?:export\s+)?const\s+(\w+)\s*=',
-            r'^(?:export\s+)?let\s+(\w+)\s*=',
-        ]
-        for line in content.splitlines():
-            for pattern in patterns:
-                match = re.match(pattern, line.strip())
-                if match:
-                    symbols.append(match.group(1))
-                    break
-    
-    return symbols[:10]
+# Only source files carry extractable symbols, and oversized ones (vendored
+# bundles, generated stubs) aren't worth reading megabytes for.
+_SYMBOL_SCAN_EXTS = frozenset({".py", ".js", ".jsx", ".ts", ".tsx"})
+MAX_SYMBOL_SCAN_BYTES = 512 * 1024
+
+
+# Role keywords compiled into one alternation per role; the keyword list
+# is only data, the hot path is a single C-level regex scan per role in
+# priority order (no keyword can span a '/', so searching the whole path
+# is equivalent to checking each component).
+_ROLE_PATTERNS = {
+    "config": ["config", "settings", ".env", "constants", "requirements", "package.json", "pyproject"],
+    "entrypoint": ["main", "app", "index", "__main__", "run", "cli", "server"],
+    "api_handler": ["api", "route", "endpoint", "controller", "handler"],
+    "component": ["component", "widget", "ui", "view", "page", "task_guide", "guide"],
+    "service": ["service", "client", "provider", "manager", "reader", "builder", "scanner", "pipeline"],
+    "model": ["model", "schema", "entity", "type"],
+    "middleware": ["middleware", "interceptor"],
+    "test": ["test", "spec", "__tests__"],
+    "util": ["util", "helper", "lib", "utils"],
+}
+
+_ROLE_RES = [
+    (role, re.compile("|".join(map(re.escape, keywords))))
+    for role, keywords in _ROLE_PATTERNS.items()
+]
+
+# framework detection - order matters!
+_FRAMEWORK_INDICATORS = {
+    "crewai": ["crew", "crewai", "ollama", "agent"],
+    "gspread": ["sheet", "google", "spreadsheet", "gspread", "reader"],
+    "langchain": ["langchain", "llm", "embedding"],
+    "react": ["components", "pages", "hooks", "/component", "/page"],
+    "vue": ["vue", "/views"],
+    "nextjs": ["next.config", "/app"],
+    "express": ["routes", "express"],
+    "fastapi": ["fastapi"],
+    "django": ["settings.py", "models.py", "views.py", "urls.py", "manage.py"],
+    "flask": ["flask"],
+}
+
+_FRAMEWORK_RES = [
+    (framework, re.compile("|".join(map(re.escape, indicators))))
+    for framework, indicators in _FRAMEWORK_INDICATORS.items()
+]
+
+
+# Repos have far fewer distinct directories (and repeated filenames like
+# __init__.py) than files, so cache per fragment: the role/framework scan
+# then runs roughly once per directory instead of once per file.
+
+@functools.lru_cache(maxsize=4096)
+def _first_role_index(fragment: str) -> int:
+    """Index of the first role matching the fragment; len(_ROLE_RES) if none."""
+    for i, (_, role_re) in enumerate(_ROLE_RES):
+        if role_re.search(fragment):
+            return i
+    return len(_ROLE_RES)
+
+
+@functools.lru_cache(maxsize=4096)
+def _first_framework_index(fragment: str) -> int:
+    """Index of the first framework matching the fragment; len(_FRAMEWORK_RES) if none."""
+    for i, (_, framework_re) in enumerate(_FRAMEWORK_RES):
+        if framework_re.search(fragment):
+            return i
+    return len(_FRAMEWORK_RES)
 
 
 def _detect_role_hint(relative_path: str) -> str:
     """Detect the role of a file based on its path using heuristics."""
     path_lower = relative_path.lower()
-    parts = path_lower.split('/')
-    filename = parts[-1] if parts else ""
-    
-    
-    role_patterns = {
-        "config": ["config", "settings", ".env", "constants", "requirements", "package.json", "pyproject"],
-        "entrypoint": ["main", "app", "index", "__main__", "run", "cli", "server"],
-        "api_handler": ["api", "route", "endpoint", "controller", "handler"],
-        "component": ["component", "widget", "ui", "view", "page", "task_guide", "guide"],
-        "service": ["service", "client", "provider", "manager", "reader", "builder", "scanner", "pipeline"],
-        "model": ["model", "schema", "entity", "type"],
-        "middleware": ["middleware", "interceptor"],
-        "test": ["test", "spec", "__tests__"],
-        "util": ["util", "helper", "lib", "utils"],
-    }
-    
-    for role, keywords in role_patterns.items():
-        for keyword in keywords:
-            if keyword in filename:
-                return role
-            for part in parts[:-1]:
-                if keyword in part:
-                    return role
-    
-    if filename in ["main.py", "app.py", "server.py", "index.js"]:
+    dir_part, _, filename = path_lower.rpartition('/')
+    idx = _first_role_index(filename)
+    if dir_part:
+        idx = min(idx, _first_role_index(dir_part))
+    if idx < len(_ROLE_RES):
+        return _ROLE_RES[idx][0]
+
+    if filename in ("main.py", "app.py", "server.py", "index.js"):
         return "entrypoint"
-    
+
     return "generic"
 
 
 def _detect_framework_hint(relative_path: str) -> str:
     """Detect the framework/tech stack based on file path."""
     path_lower = relative_path.lower()
-    
+
     # Check for documentation files first - they are documentation, not framework-specific
     if path_lower.endswith('.md') or path_lower.endswith('.txt'):
         return "documentation"
-    
-    # framework detection - order matters!
-    framework_indicators = {
-        "crewai": ["crew", "crewai", "ollama", "agent"],
-        "gspread": ["sheet", "google", "spreadsheet", "gspread", "reader"],
-        "langchain": ["langchain", "llm", "embedding"],
-        "react": ["components", "pages", "hooks", "/component", "/page"],
-        "vue": ["vue", "/views"],
-        "nextjs": ["next.config", "/app"],
-        "express": ["routes", "express"],
-        "fastapi": ["fastapi"],
-        "django": ["settings.py", "models.py", "views.py", "urls.py", "manage.py"],
-        "flask": ["flask"],
-    }
-    
-    for framework, indicators in framework_indicators.items():
-        for indicator in indicators:
-            if indicator in path_lower:
-                return framework
-    
+
+    dir_part, _, filename = path_lower.rpartition('/')
+    if dir_part:
+        # '/'-anchored indicators like '/page' may match at the directory/
+        # filename boundary, so the filename fragment keeps its slash.
+        idx = min(_first_framework_index(dir_part), _first_framework_index('/' + filename))
+    else:
+        idx = _first_framework_index(filename)
+    if idx < len(_FRAMEWORK_RES):
+        return _FRAMEWORK_RES[idx][0]
+
     return ""
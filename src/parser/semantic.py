@@ -0,0 +1,58 @@
+"""
+Semantic (signature-level) symbol extraction for the codebase index.
+Emits compact signatures (def foo(a,b), class Bar) instead of bare names
+so the LLM sees call shapes without us shipping file bodies in the prompt.
+"""
+
+import ast
+import re
+
+# Matches top-level JS/TS declarations and captures name + parameter list.
+_JS_SIGNATURE_RE = re.compile(
+    r"^(?:export\s+)?(?:function|class|const|let)\s+(\w+)\s*(\([^)\n]*\))?",
+    re.MULTILINE,
+)
+
+# Fallback for Python files ast can't parse (syntax errors, newer syntax):
+# one C-level multiline scan instead of a per-line Python loop.
+_PY_SYMBOL_RE = re.compile(r"^(?:async\s+)?(def|class)\s+(\w+)", re.MULTILINE)
+
+
+def extract_signatures(content: str, ext: str, limit: int = 10) -> list[str]:
+    """Return up to `limit` compact top-level signatures for a source file."""
+    if ext == ".py":
+        return _python_signatures(content, limit)
+    if ext in (".js", ".jsx", ".ts", ".tsx"):
+        return _js_signatures(content, limit)
+    return []
+
+
+def _python_signatures(content: str, limit: int) -> list[str]:
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        # Unparseable file: salvage names with the regex fallback.
+        return [
+            f"{kind} {name}" for kind, name in _PY_SYMBOL_RE.findall(content)[:limit]
+        ]
+    out: list[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            out.append(f"def {node.name}({ast.unparse(node.args).replace(' ', '')})")
+        elif isinstance(node, ast.AsyncFunctionDef):
+            out.append(f"async def {node.name}({ast.unparse(node.args).replace(' ', '')})")
+        elif isinstance(node, ast.ClassDef):
+            out.append(f"class {node.name}")
+        if len(out) >= limit:
+            break
+    return out
+
+
+def _js_signatures(content: str, limit: int) -> list[str]:
+    out: list[str] = []
+    for m in _JS_SIGNATURE_RE.finditer(content):
+        name, params = m.group(1), m.group(2)
+        out.append(f"{name}{params.replace(' ', '')}" if params else name)
+        if len(out) >= limit:
+            break
+    return out
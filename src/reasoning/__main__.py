@@ -11,10 +11,10 @@ from .task_guide import generate_task_guide
 
 # Optional: Phase 1 parser and Phase 2 sheet reader
 def _get_index_from_root(root: Path, max_files: int = 300) -> str:
-    from src.parser import scan_project, build_index, format_index_for_llm
-    files = scan_project(root)
-    index = build_index(files)
-    return format_index_for_llm(index, max_files=max_files)
+    from src.parser import scan_project, build_index
+    files = scan_project(root, max_detailed=max_files)
+    # Render the LLM text directly; the structured index isn't needed here.
+    return build_index(files, llm_text=True, max_files=max_files)
 
 
 def main() -> None:
@@ -27,6 +27,7 @@ def main() -> None:
     ap.add_argument("--task-id", "-i", help="Task ID in sheet (requires --sheet)")
     ap.add_argument("--model", "-m", default="llama3", help="Ollama model name")
     ap.add_argument("--ollama-host", help="Ollama host (default: localhost:11434)")
+    ap.add_argument("--keep-alive", default="30m", help="How long Ollama keeps the model loaded (0 to unload)")
     ap.add_argument("--max-files", type=int, default=300, help="Max files in codebase context")
     args = ap.parse_args()
 
@@ -74,6 +75,7 @@ def main() -> None:
         codebase_index_text=codebase_text,
         model=args.model,
         ollama_host=args.ollama_host,
+        keep_alive=args.keep_alive,
     )
 
     print("=== FILES TO TOUCH (in order) ===")
@@ -4,10 +4,39 @@ Given a task (title + description) and codebase index, returns a step-by-step gu
 and which files to touch in what order.
 """
 
+import functools
+import json
+import os
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 
-from ollama import chat
+from src.parser.cache import hash_bytes
+
+# ollama (and its httpx dependency) is imported lazily so callers that only
+# parse responses — or CLIs that never reach the LLM — skip its import cost.
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(host: str):
+    """One ollama Client per host, so its connection pool is reused."""
+    from ollama import Client
+
+    return Client(host=host)
+
+try:
+    # orjson parses/serializes several times faster than stdlib json.
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
 
 
 @dataclass
@@ -18,28 +47,71 @@ class TaskGuideResult:
     steps_text: str = ""
 
 
-SYSTEM_PROMPT = """You are an expert onboarding assistant for new developers. Given a task and a codebase structure (file tree and file list), you produce:
+def _load_cached_guide(cache_path: Path) -> TaskGuideResult | None:
+    """Load a cached guide; returns None on missing/corrupt cache."""
+    try:
+        data = _loads(cache_path.read_bytes())
+        return TaskGuideResult(
+            raw_response=data["raw_response"],
+            files_ordered=list(data.get("files_ordered", [])),
+            steps_text=data.get("steps_text", ""),
+        )
+    except Exception:
+        return None
+
+
+def _save_cached_guide(cache_path: Path, result: TaskGuideResult) -> None:
+    """Write a guide to the cache; best-effort, failures are ignored."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(_dumps(asdict(result)))
+    except Exception:
+        pass
+
+
+# The system message carries everything shared across tasks (instructions +
+# codebase index) and the user message only the task, so consecutive calls
+# against the same codebase present a byte-identical prefix that Ollama can
+# serve from its prefill KV cache.
+SYSTEM_PROMPT_TEMPLATE = """You are an expert onboarding assistant for new developers. Given a task and a codebase structure (file tree and file list), you produce:
 1. An ordered list of file paths that the developer should look at or modify to complete the task (from the provided codebase only; use exact paths as shown).
 2. A clear step-by-step guide to complete the task.
 
-Be concise. Prefer files that are clearly relevant (e.g. config, API clients, components mentioned in the task). Order files by dependency or logical workflow (e.g. config first, then API layer, then UI)."""
+Be concise. Prefer files that are clearly relevant (e.g. config, API clients, components mentioned in the task). Order files by dependency or logical workflow (e.g. config first, then API layer, then UI).
 
-USER_PROMPT_TEMPLATE = """## Task
-**Title:** {title}
+Respond with two sections:
 
-**Description:** {description}
+**FILES TO TOUCH (in order):**
+List each file path on its own line, numbered (1. path, 2. path, ...). Use only paths that appear in the codebase below.
+
+**STEP-BY-STEP GUIDE:**
+Numbered steps to complete the task. Be specific and reference the files you listed.
 
 ## Codebase structure (reference only — suggest files from this list)
-{codebase_index}
+{codebase_index}"""
 
----
-Respond with two sections:
+USER_PROMPT_TEMPLATE = """## Task
+**Title:** {title}
 
-**FILES TO TOUCH (in order):**
-List each file path on its own line, numbered (1. path, 2. path, ...). Use only paths that appear in the codebase above.
+**Description:** {description}"""
 
-**STEP-BY-STEP GUIDE:**
-Numbered steps to complete the task. Be specific and reference the files you listed."""
+
+def _ollama_options(prompt_chars: int) -> dict:
+    """
+    Runtime options sized to the prompt: the smallest power-of-two context
+    window that fits (plus headroom for the response) keeps the KV cache —
+    and the memory-bound decode — as small as possible.
+    """
+    prompt_tokens = prompt_chars // 4 + 512  # rough 4-chars/token estimate
+    num_ctx = 1 << (prompt_tokens - 1).bit_length()
+    return {
+        "num_ctx": max(2048, min(num_ctx, 8192)),
+        "num_batch": 512,
+        "num_thread": os.cpu_count(),
+        # Keep the whole prompt in the KV cache so the shared system prefix
+        # is reused across consecutive tasks on the same codebase.
+        "num_keep": -1,
+    }
 
 
 def generate_task_guide(
@@ -49,75 +121,104 @@ def generate_task_guide(
     model: str = "llama3",
     ollama_host: str | None = None,
     max_context_chars: int = 12000,
+    stream: bool = False,
+    cache_dir: str | Path | None = None,
+    keep_alive: str | int = "30m",
 ) -> TaskGuideResult:
     """
     Call Ollama to generate a task breakdown and ordered file list.
     Requires Ollama running locally (e.g. ollama serve) and the model pulled (e.g. ollama pull llama3).
+    With stream=True, tokens are printed to stdout as they arrive (so the
+    user starts reading immediately) and parsing happens on the full text.
+    If cache_dir is given, responses are cached on disk keyed by
+    (model, task, codebase index) so unchanged inputs skip the LLM call.
+    keep_alive keeps the model resident in Ollama between CLI runs so
+    repeat invocations skip the multi-second model load (0 to force unload).
     """
     if len(codebase_index_text) > max_context_chars:
         codebase_index_text = codebase_index_text[:max_context_chars] + "\n\n... (truncated)"
+    cache_path = None
+    if cache_dir is not None:
+        key = hash_bytes(
+            f"{model}|{task_title}|{task_description}|{codebase_index_text}".encode()
+        )
+        cache_path = Path(cache_dir) / f"guide_{key:016x}.json"
+        cached = _load_cached_guide(cache_path)
+        if cached is not None:
+            if stream:
+                # Nothing was streamed; show the cached guide in full.
+                print(cached.raw_response, flush=True)
+            return cached
+    system_content = SYSTEM_PROMPT_TEMPLATE.format(codebase_index=codebase_index_text)
     user_content = USER_PROMPT_TEMPLATE.format(
         title=task_title or "(no title)",
         description=task_description or "(no description)",
-        codebase_index=codebase_index_text,
     )
     messages = [
-        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "system", "content": system_content},
         {"role": "user", "content": user_content},
     ]
     if ollama_host:
-        from ollama import Client
-        client = Client(host=ollama_host)
-        response = client.chat(model=model, messages=messages)
+        chat_fn = _get_client(ollama_host).chat
+    else:
+        from ollama import chat as chat_fn
+    options = _ollama_options(len(system_content) + len(user_content))
+    if stream:
+        parts: list[str] = []
+        for chunk in chat_fn(
+            model=model, messages=messages, stream=True, keep_alive=keep_alive, options=options
+        ):
+            token = (chunk.get("message") or {}).get("content") or ""
+            print(token, end="", flush=True)
+            parts.append(token)
+        print(flush=True)
+        raw = "".join(parts)
     else:
-        response = chat(model=model, messages=messages)
-    raw = (response.get("message") or {}).get("content") or ""
+        response = chat_fn(model=model, messages=messages, keep_alive=keep_alive, options=options)
+        raw = (response.get("message") or {}).get("content") or ""
 
     files_ordered = _parse_files_section(raw)
     steps_text = _parse_steps_section(raw)
 
-    return TaskGuideResult(
+    result = TaskGuideResult(
         raw_response=raw,
         files_ordered=files_ordered,
         steps_text=steps_text,
     )
+    if cache_path is not None:
+        _save_cached_guide(cache_path, result)
+    return result
+
+
+# Compiled once: these run on every Ollama response.
+# Section like "FILES TO TOUCH (in order):" or "**FILES TO TOUCH (in order):**"
+_FILES_SECTION_RE = re.compile(
+    r"\*\*?FILES TO TOUCH.*?\*\*?\s*\n(.*?)(?=\n\s*\*\*?STEP|\n\s*$|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+_NUMBERED_LINE_RE = re.compile(r"^\s*\d+[.)]\s+(.+?)\s*$", re.MULTILINE)
+_STEPS_SECTION_RE = re.compile(
+    r"\*\*?STEP-BY-STEP GUIDE\*\*?\s*\n(.*)",
+    re.DOTALL | re.IGNORECASE,
+)
 
 
 def _parse_files_section(text: str) -> list[str]:
     """Extract numbered file paths from a 'FILES TO TOUCH' section."""
-    files: list[str] = []
-    # Look for section like "FILES TO TOUCH (in order):" or "**FILES TO TOUCH (in order):**"
-    section = re.search(
-        r"\*\*?FILES TO TOUCH.*?\*\*?\s*\n(.*?)(?=\n\s*\*\*?STEP|\n\s*$|\Z)",
-        text,
-        re.DOTALL | re.IGNORECASE,
-    )
+    section = _FILES_SECTION_RE.search(text)
     if not section:
         # Fallback: lines that look like "1. path/to/file"
-        for line in text.splitlines():
-            m = re.match(r"^\s*\d+[.)]\s+(.+)$", line)
-            p = m.group(1).strip()
-            if "/" in p or p.endswith((".py", ".js", ".ts", ".tsx", ".jsx", ".json", ".env")):
-                files.append(p)
-        return files
-    block = section.group(1)
-    for line in block.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        m = re.match(r"^\d+[.)]\s+(.+)$", line)
-        if m:
-            files.append(m.group(1).strip())
-    return files
+        return [
+            p
+            for p in (m.group(1) for m in _NUMBERED_LINE_RE.finditer(text))
+            if "/" in p or p.endswith((".py", ".js", ".ts", ".tsx", ".jsx", ".json", ".env"))
+        ]
+    return [m.group(1) for m in _NUMBERED_LINE_RE.finditer(section.group(1))]
 
 
 def _parse_steps_section(text: str) -> str:
     """Extract the STEP-BY-STEP GUIDE section."""
-    section = re.search(
-        r"\*\*?STEP-BY-STEP GUIDE\*\*?\s*\n(.*)",
-        text,
-        re.DOTALL | re.IGNORECASE,
-    )
+    section = _STEPS_SECTION_RE.search(text)
     if section:
         return section.group(1).strip()
     return ""
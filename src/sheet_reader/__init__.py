@@ -7,10 +7,10 @@ from .config import get_credentials_path
 
 # Lazy import so scripts can use get_credentials_path without requiring gspread
 def __getattr__(name: str):
-    if name in ("SheetTaskReader", "TaskRow"):
-        from .reader import SheetTaskReader, TaskRow
-        return SheetTaskReader if name == "SheetTaskReader" else TaskRow
+    if name in ("SheetTaskReader", "TaskRow", "LoadedSheet"):
+        from . import reader
+        return getattr(reader, name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = ["get_credentials_path", "SheetTaskReader", "TaskRow"]
+__all__ = ["get_credentials_path", "SheetTaskReader", "TaskRow", "LoadedSheet"]
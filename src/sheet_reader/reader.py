@@ -3,24 +3,109 @@ Read tasks from a Google Sheet by task_id or assignee.
 Uses credentials.json (service account) for authentication.
 """
 
+import functools
+import operator
+import random
+import sys
+import time
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import gspread
 
 from .config import get_credentials_path
 
 
-@dataclass
+# Transient statuses worth retrying: rate limits and server-side hiccups.
+# Other 4xx errors (bad range, no access) propagate immediately.
+_RETRY_STATUS_CODES = (429, 500, 503)
+_MAX_RETRY_ATTEMPTS = 5
+
+
+def _retry_on_rate_limit(func):
+    """
+    Retry Sheets API calls that fail with a transient status, using
+    jittered exponential backoff (1s..30s, up to 5 attempts). 429s are
+    routine under the per-user read quota; backing off preserves
+    throughput instead of surfacing spurious failures.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        delay = 1.0
+        for attempt in range(_MAX_RETRY_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as err:
+                status = getattr(getattr(err, "response", None), "status_code", None)
+                if status not in _RETRY_STATUS_CODES or attempt == _MAX_RETRY_ATTEMPTS - 1:
+                    raise
+                time.sleep(random.uniform(0.5, 1.0) * min(delay, 30.0))
+                delay *= 2
+    return wrapper
+
+
+@functools.lru_cache(maxsize=4)
+def _build_client(credentials_path: str) -> gspread.Client:
+    """
+    Build (and memoize) an authorized gspread client so repeated readers
+    reuse one parsed credential, signed JWT, and TCP+TLS session instead
+    of re-authenticating per call.
+
+    The memo lives for the process: rotating the credentials file in place
+    requires _build_client.cache_clear() (or a new process) to take effect.
+    """
+    client = gspread.service_account(
+        filename=credentials_path,
+        scopes=gspread.auth.READONLY_SCOPES,
+    )
+    try:
+        # Keep-alive pool sized for get_all_tasks_multi's concurrency, so
+        # parallel worksheet fetches reuse warm TLS connections instead of
+        # re-handshaking. requests.Session is thread-safe for this use.
+        # (HTTP/2 multiplexing would need an httpx transport, which gspread's
+        # requests-based http client can't take.)
+        from requests.adapters import HTTPAdapter
+        client.http_client.session.mount(
+            "https://", HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        )
+    except Exception:
+        pass  # Pooling is an optimization; the client works without it.
+    return client
+
+
+@dataclass(slots=True, frozen=True)
 class TaskRow:
-    """A single task row from the sheet."""
+    """A single task row from the sheet (immutable and hashable)."""
     task_id: str
     assignee: str
     title: str
     description: str
     status: str
-    raw_row: dict[str, Any]  # all columns as key -> value
+    # Backing data for raw_row: the headers tuple is shared across every
+    # row of a fetch, and the dict is only built if raw_row is accessed.
+    headers: tuple[str, ...] = ()
+    row: tuple[str, ...] = ()
+
+    @property
+    def raw_row(self) -> dict[str, Any]:
+        """All columns as key -> value."""
+        return dict(zip(self.headers, self.row))
+
+
+@dataclass
+class LoadedSheet:
+    """
+    One fetched worksheet, normalized and indexed for repeated lookups.
+    Fetch once via SheetTaskReader.load(), then do as many point lookups
+    against tasks/by_id/by_assignee as needed without further API calls.
+    """
+    tasks: list[TaskRow]
+    by_id: dict[str, TaskRow]  # casefolded task_id -> row (first wins)
+    by_assignee: dict[str, list[TaskRow]]  # casefolded assignee -> rows
+    fetched_at: float
 
 
 class SheetTaskReader:
@@ -39,16 +124,32 @@ class SheetTaskReader:
         title_col: str = "title",
         description_col: str = "description",
         status_col: str = "status",
+        cache_ttl: float = 30.0,
     ):
         if credentials_path is None:
             credentials_path = get_credentials_path(project_root)
-        self.credentials_path = Path(credentials_path)
+        # Resolved once here; the existence check stays in _get_client so a
+        # reader constructed before credentials exist (callers report that
+        # error at fetch time) doesn't blow up early.
+        self.credentials_path = Path(credentials_path).resolve(strict=False)
         self.task_id_col = task_id_col
         self.assignee_col = assignee_col
         self.title_col = title_col
         self.description_col = description_col
         self.status_col = status_col
+        self.cache_ttl = cache_ttl
         self._client: gspread.Client | None = None
+        self._spreadsheets: dict[str, gspread.Spreadsheet] = {}
+        self._worksheets: dict[tuple[str, int], gspread.Worksheet] = {}
+        self._builders: dict[tuple[str, ...], Any] = {}
+        # (sheet, worksheet) -> LoadedSheet; consecutive lookups within
+        # cache_ttl seconds reuse one API round trip, and point lookups use
+        # the prebuilt indexes.
+        self._cache: dict[tuple[str, int], LoadedSheet] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached rows so the next read refetches from the API."""
+        self._cache.clear()
 
     def _get_client(self) -> gspread.Client:
         if self._client is None:
@@ -57,86 +158,323 @@ class SheetTaskReader:
                     f"Credentials not found: {self.credentials_path}. "
                     "Place credentials.json in project root or set GOOGLE_APPLICATION_CREDENTIALS."
                 )
-            self._client = gspread.service_account(
-                filename=str(self.credentials_path),
-                scopes=gspread.auth.READONLY_SCOPES,
-            )
+            self._client = _build_client(str(self.credentials_path))
         return self._client
 
+    def _open_spreadsheet(self, sheet_key_or_url: str) -> gspread.Spreadsheet:
+        """Open (and memoize) a spreadsheet so repeat calls skip the metadata fetch."""
+        spreadsheet = self._spreadsheets.get(sheet_key_or_url)
+        if spreadsheet is None:
+            client = self._get_client()
+            if sheet_key_or_url.startswith("http"):
+                spreadsheet = client.open_by_url(sheet_key_or_url)
+            else:
+                spreadsheet = client.open_by_key(sheet_key_or_url)
+            self._spreadsheets[sheet_key_or_url] = spreadsheet
+        return spreadsheet
+
+    @_retry_on_rate_limit
     def open_sheet(self, sheet_key_or_url: str, worksheet_index: int = 0) -> gspread.Worksheet:
         """
         Open a spreadsheet by key (from URL) or full URL.
         Returns the first worksheet by default; use worksheet_index for others.
+        Worksheets are memoized: gspread's get_worksheet re-fetches sheet
+        metadata on every call, so each load would otherwise pay two round
+        trips (metadata + values) instead of one.
+        """
+        key = (sheet_key_or_url, worksheet_index)
+        ws = self._worksheets.get(key)
+        if ws is None:
+            ws = self._open_spreadsheet(sheet_key_or_url).get_worksheet(worksheet_index)
+            self._worksheets[key] = ws
+        return ws
+
+    @_retry_on_rate_limit
+    def fetch_ranges(self, sheet_key_or_url: str, ranges: list[str]) -> list[list[list[Any]]]:
+        """
+        Fetch several A1 ranges in a single values.batchGet round trip
+        (one HTTPS request instead of one per range).
+        """
+        spreadsheet = self._open_spreadsheet(sheet_key_or_url)
+        resp = spreadsheet.values_batch_get(ranges=ranges)
+        return [vr.get("values", []) for vr in resp.get("valueRanges", [])]
+
+    @staticmethod
+    @_retry_on_rate_limit
+    def _fetch_values(ws: gspread.Worksheet) -> list[list[Any]]:
+        """
+        Fetch a worksheet's values in one call, consuming the raw response
+        instead of get_all_values, whose post-pass pads every row into a
+        rectangle — our row handling only pads the rows it actually reads.
+        Falls back to get_all_values if the raw endpoint isn't available.
+        """
+        try:
+            title = ws.title.replace("'", "''")
+            resp = ws.spreadsheet.values_get(f"'{title}'")
+            return resp.get("values", [])
+        except (AttributeError, TypeError):
+            return ws.get_all_values()
+
+    def _column_indexes(self, headers: tuple[str, ...]) -> dict[str, int]:
+        """
+        Resolve the configured column names to integer offsets once per
+        fetch, so each row is read by index instead of chained dict gets.
+        Missing columns map to -1 (read as empty).
         """
-        client = self._get_client()
-        if sheet_key_or_url.startswith("http"):
-            spreadsheet = client.open_by_url(sheet_key_or_url)
+        indexes = {}
+        for field, configured in (
+            ("task_id", self.task_id_col),
+            ("assignee", self.assignee_col),
+            ("title", self.title_col),
+            ("description", self.description_col),
+            ("status", self.status_col),
+        ):
+            key = configured.strip().lower().replace(" ", "_")
+            indexes[field] = headers.index(key) if key in headers else -1
+        return indexes
+
+    def _row_builder(self, headers: tuple[str, ...]):
+        """
+        Specialize a row -> TaskRow constructor for one headers layout.
+        When every configured column exists, a single itemgetter pulls all
+        five cells in one C call; the bounds-checked path only remains for
+        sheets missing columns. Returns (builder, task_id_index), cached
+        per headers tuple.
+        """
+        cached = self._builders.get(headers)
+        if cached is not None:
+            return cached
+        idx = self._column_indexes(headers)
+        indices = (idx["task_id"], idx["assignee"], idx["title"], idx["description"], idx["status"])
+        if all(i >= 0 for i in indices):
+            getter = operator.itemgetter(*indices)
+
+            def builder(row: list) -> TaskRow:
+                task_id, assignee, title, description, status = getter(row)
+                return TaskRow(
+                    task_id=str(task_id).strip(),
+                    assignee=str(assignee).strip(),
+                    title=str(title).strip(),
+                    description=str(description).strip(),
+                    status=str(status).strip(),
+                    headers=headers,
+                    row=tuple(row[: len(headers)]),
+                )
         else:
-            spreadsheet = client.open_by_key(sheet_key_or_url)
-        return spreadsheet.get_worksheet(worksheet_index)
-
-    def _row_to_task(self, headers: list[str], row: list[Any]) -> TaskRow | None:
-        raw = dict(zip(headers, row))
-        task_id = raw.get(self.task_id_col, raw.get("Task ID", ""))
-        if not str(task_id).strip():
-            return None
-        return TaskRow(
-            task_id=str(task_id).strip(),
-            assignee=str(raw.get(self.assignee_col, raw.get("Assignee", "")) or "").strip(),
-            title=str(raw.get(self.title_col, raw.get("Title", "")) or "").strip(),
-            description=str(raw.get(self.description_col, raw.get("Description", "")) or "").strip(),
-            status=str(raw.get(self.status_col, raw.get("Status", "")) or "").strip(),
-            raw_row=raw,
+            i_task, i_assignee, i_title, i_description, i_status = indices
+
+            def cell(row: list, i: int) -> str:
+                return str(row[i]).strip() if 0 <= i < len(row) else ""
+
+            def builder(row: list) -> TaskRow:
+                return TaskRow(
+                    task_id=cell(row, i_task),
+                    assignee=cell(row, i_assignee),
+                    title=cell(row, i_title),
+                    description=cell(row, i_description),
+                    status=cell(row, i_status),
+                    headers=headers,
+                    row=tuple(row[: len(headers)]),
+                )
+
+        self._builders[headers] = (builder, idx["task_id"])
+        return self._builders[headers]
+
+    def _normalized_rows(self, rows: list[list[Any]]) -> Iterator[TaskRow]:
+        """Yield TaskRows (skipping id-less rows) from raw values."""
+        # Interned: the same header names recur on every fetch (and as dict
+        # keys whenever raw_row is built), so key comparison becomes a
+        # pointer check.
+        headers = (
+            tuple(sys.intern(str(h).strip().lower().replace(" ", "_")) for h in rows[0])
+            if rows
+            else ()
         )
+        build, i_task = self._row_builder(headers)
+        n_headers = len(headers)
+        for row in rows[1:]:
+            # Skip id-less rows (Sheets pads to 1000 rows by default) before
+            # padding or constructing anything for them.
+            id_cell = row[i_task] if 0 <= i_task < len(row) else ""
+            if not id_cell or not str(id_cell).strip():
+                continue
+            if len(row) < n_headers:
+                # Extend in place (the rows are our own fetch) — no fresh
+                # list per short row, and full rows pay nothing.
+                row.extend(repeat("", n_headers - len(row)))
+            yield build(row)
 
-    def get_all_tasks(
+    def iter_tasks(
+        self,
+        sheet_key_or_url: str,
+        worksheet_index: int = 0,
+    ) -> Iterator[TaskRow]:
+        """
+        Yield tasks one at a time. Serves from the cache when fresh;
+        otherwise rows are normalized lazily as consumed (and not cached),
+        so scanning for an early match doesn't build every TaskRow.
+        """
+        hit = self._cache.get((sheet_key_or_url, worksheet_index))
+        if hit is not None and time.monotonic() - hit.fetched_at < self.cache_ttl:
+            yield from hit.tasks
+            return
+        ws = self.open_sheet(sheet_key_or_url, worksheet_index)
+        yield from self._normalized_rows(self._fetch_values(ws))
+
+    def load(
         self,
         sheet_key_or_url: str,
         worksheet_index: int = 0,
+    ) -> LoadedSheet:
+        """
+        Fetch a worksheet once (header row required) and return the indexed
+        handle. Cached for cache_ttl seconds per (sheet, worksheet), so
+        bursts of lookups share one fetch; call invalidate() to force a
+        refetch.
+        """
+        cache_key = (sheet_key_or_url, worksheet_index)
+        hit = self._cache.get(cache_key)
+        if hit is not None and time.monotonic() - hit.fetched_at < self.cache_ttl:
+            return hit
+        ws = self.open_sheet(sheet_key_or_url, worksheet_index)
+        rows = self._fetch_values(ws)
+        tasks: list[TaskRow] = []
+        # Point-lookup indexes built in the same pass over the rows.
+        by_id: dict[str, TaskRow] = {}
+        by_assignee: dict[str, list[TaskRow]] = {}
+        for t in self._normalized_rows(rows):
+            tasks.append(t)
+            # casefold, not lower: correct case-insensitive matching
+            # for non-ASCII ids/names too.
+            by_id.setdefault(t.task_id.casefold(), t)
+            by_assignee.setdefault(t.assignee.casefold(), []).append(t)
+        loaded = LoadedSheet(
+            tasks=tasks,
+            by_id=by_id,
+            by_assignee=by_assignee,
+            fetched_at=time.monotonic(),
+        )
+        self._cache[cache_key] = loaded
+        return loaded
+
+    @staticmethod
+    def _col_letter(index: int) -> str:
+        """0-based column index -> A1 column letters (0 -> A, 26 -> AA)."""
+        letters = ""
+        index += 1
+        while index:
+            index, rem = divmod(index - 1, 26)
+            letters = chr(ord("A") + rem) + letters
+        return letters
+
+    @_retry_on_rate_limit
+    def _load_projected(
+        self,
+        sheet_key_or_url: str,
+        worksheet_index: int,
+        columns: frozenset[str],
     ) -> list[TaskRow]:
-        """Fetch all rows (header row required). Returns list of TaskRow."""
+        """
+        Fetch only the requested logical fields: one header read to locate
+        the columns, then one batchGet restricted to those column ranges,
+        so bytes over the wire scale with the projection, not the sheet.
+        """
         ws = self.open_sheet(sheet_key_or_url, worksheet_index)
-        rows = ws.get_all_values()
-        if not rows:
+        title = ws.title.replace("'", "''")
+        header_rows = ws.spreadsheet.values_get(f"'{title}'!1:1").get("values", [[]])
+        headers = tuple(
+            sys.intern(str(h).strip().lower().replace(" ", "_")) for h in header_rows[0]
+        )
+        idx = self._column_indexes(headers)
+        wanted = {
+            field: i
+            for field, i in idx.items()
+            if i >= 0 and (field == "task_id" or field in columns)
+        }
+        if "task_id" not in wanted:
             return []
-        headers = [str(h).strip().lower().replace(" ", "_") for h in rows[0]]
-        # Normalize our expected column names to possible header variants
-        header_map = {h: h for h in headers}
-        tasks = []
-        for row in rows[1:]:
-            if len(row) < len(headers):
-                row = row + [""] * (len(headers) - len(row))
-            raw = dict(zip(headers, row[: len(headers)]))
-            task_id = raw.get("task_id") or raw.get("task id") or ""
-            assignee = raw.get("assignee") or ""
-            title = raw.get("title") or ""
-            description = raw.get("description") or ""
-            status = raw.get("status") or ""
-            t = TaskRow(
-                task_id=str(task_id).strip(),
-                assignee=str(assignee).strip(),
-                title=str(title).strip(),
-                description=str(description).strip(),
-                status=str(status).strip(),
-                raw_row=raw,
+        fields = sorted(wanted)
+        ranges = [
+            f"'{title}'!{self._col_letter(wanted[f])}2:{self._col_letter(wanted[f])}"
+            for f in fields
+        ]
+        resp = ws.spreadsheet.values_batch_get(ranges=ranges)
+        col_values = [vr.get("values", []) for vr in resp.get("valueRanges", [])]
+        n_rows = max((len(c) for c in col_values), default=0)
+        tasks: list[TaskRow] = []
+        for r in range(n_rows):
+            cells = {}
+            for f, col in zip(fields, col_values):
+                v = col[r][0] if r < len(col) and col[r] else ""
+                cells[f] = str(v).strip()
+            if not cells.get("task_id"):
+                continue
+            tasks.append(
+                TaskRow(
+                    task_id=cells.get("task_id", ""),
+                    assignee=cells.get("assignee", ""),
+                    title=cells.get("title", ""),
+                    description=cells.get("description", ""),
+                    status=cells.get("status", ""),
+                )
             )
-            if t.task_id:
-                tasks.append(t)
         return tasks
 
+    def get_all_tasks(
+        self,
+        sheet_key_or_url: str,
+        worksheet_index: int = 0,
+        columns: Iterable[str] | None = None,
+    ) -> list[TaskRow]:
+        """
+        Fetch all rows (header row required). Returns list of TaskRow.
+        columns restricts the fetch to those logical fields (e.g.
+        {"task_id", "title"}): only the matching sheet columns travel over
+        the wire and the other fields come back empty. Projected fetches
+        bypass the TTL cache and carry no raw_row.
+        """
+        if columns is not None:
+            return self._load_projected(sheet_key_or_url, worksheet_index, frozenset(columns))
+        return self.load(sheet_key_or_url, worksheet_index).tasks
+
+    def get_all_tasks_multi(
+        self,
+        sheet_key_or_url: str,
+        worksheet_indices: list[int],
+    ) -> dict[int, list[TaskRow]]:
+        """
+        Fetch several worksheets concurrently (e.g. multiple task boards);
+        wall time is roughly one HTTPS round trip instead of one per
+        worksheet. Returns {worksheet_index: tasks}. The pooled session
+        behind the shared client is safe for this concurrency.
+        """
+        if not worksheet_indices:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(worksheet_indices))) as ex:
+            return dict(
+                ex.map(
+                    lambda i: (i, self.get_all_tasks(sheet_key_or_url, i)),
+                    worksheet_indices,
+                )
+            )
+
     def get_task_by_id(
         self,
         sheet_key_or_url: str,
         task_id: str,
         worksheet_index: int = 0,
     ) -> TaskRow | None:
-        """Return the first task row whose task_id matches (case-insensitive)."""
-        tasks = self.get_all_tasks(sheet_key_or_url, worksheet_index)
-        task_id_clean = str(task_id).strip().lower()
-        for t in tasks:
-            if t.task_id.lower() == task_id_clean:
-                return t
-        return None
+        """
+        Return the first task row whose task_id matches (case-insensitive).
+
+        Point lookups deliberately go through the cached, indexed load()
+        rather than server-side filtering: the v4 values API cannot filter
+        rows, and the gviz query endpoint is unauthenticated (it would
+        break sheets shared only with the service account). One cached
+        fetch amortized across lookups beats per-lookup round trips.
+        """
+        loaded = self.load(sheet_key_or_url, worksheet_index)
+        return loaded.by_id.get(str(task_id).strip().casefold())
 
     def get_tasks_for_assignee(
         self,
@@ -145,6 +483,5 @@ class SheetTaskReader:
         worksheet_index: int = 0,
     ) -> list[TaskRow]:
         """Return all tasks where assignee matches (case-insensitive)."""
-        tasks = self.get_all_tasks(sheet_key_or_url, worksheet_index)
-        assignee_clean = str(assignee).strip().lower()
-        return [t for t in tasks if t.assignee.lower() == assignee_clean]
+        loaded = self.load(sheet_key_or_url, worksheet_index)
+        return list(loaded.by_assignee.get(str(assignee).strip().casefold(), []))